@@ -5,11 +5,16 @@ A fast, multi-threaded download manager
 
 import sys
 import asyncio
+import logging
+import logging.handlers
+import queue
 import signal
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 
 from src.ui.main_window import MainWindow
+from src.ui.styles import DARK_THEME
+from src.ui.download_item import warm_icon_cache
 
 
 class AsyncRunner:
@@ -52,20 +57,50 @@ class AsyncRunner:
         self.loop.run_forever()
 
 
+def setup_logging() -> logging.handlers.QueueListener:
+    """Route log records through a queue so the UI thread never blocks on stream IO"""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.WARNING)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    # The listener formats and writes records on its own thread
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 def main():
     """Main entry point"""
+    log_listener = setup_logging()
+    
     # Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("i-Downloader")
     app.setApplicationVersion("1.0.0")
     
+    # Apply the theme once, app-wide, before any widget is created so the
+    # stylesheet is parsed once and widgets are polished as they are built
+    app.setStyleSheet(DARK_THEME)
+    
     # Create main window
     window = MainWindow()
     window.show()
     
+    # Load the icon font and build row icons once the window is up, on the GUI
+    # thread (QIcon and QFont must not be created from worker threads)
+    QTimer.singleShot(0, warm_icon_cache)
+    
     # Run with async support
     runner = AsyncRunner(app, window)
-    sys.exit(runner.run())
+    try:
+        exit_code = runner.run()
+    finally:
+        log_listener.stop()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
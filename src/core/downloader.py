@@ -4,6 +4,7 @@ Main download manager - orchestrates all downloads
 
 import asyncio
 import aiohttp
+import logging
 import os
 import ssl
 import tempfile
@@ -16,7 +17,7 @@ from .segment import SegmentDownloader
 from .file_utils import merge_segments, create_segment_files, cleanup_temp_files
 from .checksum import ChecksumVerifier
 from ..models.download import Download, SegmentInfo
-from ..models.database import Database
+from ..models.database import Database, DatabaseWriter
 from ..utils.constants import (
     DEFAULT_SEGMENTS,
     DEFAULT_MAX_CONCURRENT,
@@ -35,6 +36,9 @@ from ..utils.helpers import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class DownloadManager:
     """
     Main download manager that handles all download operations.
@@ -70,6 +74,7 @@ class DownloadManager:
         self.segment_downloaders: Dict[str, List[SegmentDownloader]] = {}
 
         self.db = Database()
+        self.db_writer = DatabaseWriter(self.db)  # All writes go through here
         self.temp_dir = APP_DATA_DIR / "temp"
         self.temp_dir.mkdir(exist_ok=True)
 
@@ -111,9 +116,9 @@ class DownloadManager:
         for download_id in list(self.active_tasks.keys()):
             await self.pause_download(download_id)
         
-        # Save all downloads to database
-        for download in self.downloads.values():
-            self.db.save_download(download)
+        # Save all downloads to database in one transaction, then stop the writer
+        self.db_writer.save_downloads(list(self.downloads.values()))
+        self.db_writer.close()
         
         if self._session:
             await self._session.close()
@@ -167,7 +172,7 @@ class DownloadManager:
         
         # Save to database and memory
         self.downloads[download.id] = download
-        self.db.save_download(download)
+        self.db_writer.save_download(download)
         
         # Notify status change
         self._notify_status(download)
@@ -184,7 +189,7 @@ class DownloadManager:
             return True  # Already downloading
         
         # Check concurrent limit
-        active_count = sum(1 for d in self.downloads.values() if d.is_active)
+        active_count = self._active_count()
         if active_count >= self.max_concurrent:
             download.status = DownloadStatus.QUEUED
             self._notify_status(download)
@@ -220,7 +225,7 @@ class DownloadManager:
             del self.active_tasks[download_id]
         
         download.status = DownloadStatus.PAUSED
-        self.db.save_download(download)
+        self.db_writer.save_download(download)
         self._notify_status(download)
         
         # Start next queued download
@@ -255,7 +260,7 @@ class DownloadManager:
         
         # Remove from memory and database
         del self.downloads[download_id]
-        self.db.delete_download(download_id)
+        self.db_writer.delete_download(download_id)
         
         # Start next queued download
         await self._start_next_queued()
@@ -284,7 +289,7 @@ class DownloadManager:
                     except (OSError, IOError) as e:
                         download.status = DownloadStatus.FAILED
                         download.error_message = f"Failed to create temp file: {str(e)}"
-                        self.db.save_download(download)
+                        self.db_writer.save_download(download)
                         self._notify_status(download)
                         return
 
@@ -360,7 +365,7 @@ class DownloadManager:
                     download.retry_count += 1
                     download.status = DownloadStatus.PAUSED  # Temporarily pause for retry
                     download.error_message = f"Download failed. Retry {download.retry_count}/{self.max_retries} in {self._calculate_retry_delay(download.retry_count):.1f}s..."
-                    self.db.save_download(download)
+                    self.db_writer.save_download(download)
                     self._notify_status(download)
 
                     # Calculate delay with exponential backoff
@@ -383,7 +388,7 @@ class DownloadManager:
             if download.id in self._speed_tracker:
                 del self._speed_tracker[download.id]
 
-            self.db.save_download(download)
+            self.db_writer.save_download(download)
             self._notify_status(download)
 
             # Start next queued download
@@ -391,7 +396,7 @@ class DownloadManager:
 
         except asyncio.CancelledError:
             # Download was paused or cancelled
-            self.db.save_download(download)
+            self.db_writer.save_download(download)
             raise
         except Exception as e:
             # Check if we should retry on exception
@@ -399,7 +404,7 @@ class DownloadManager:
                 download.retry_count += 1
                 download.status = DownloadStatus.PAUSED
                 download.error_message = f"Error: {str(e)}. Retry {download.retry_count}/{self.max_retries} in {self._calculate_retry_delay(download.retry_count):.1f}s..."
-                self.db.save_download(download)
+                self.db_writer.save_download(download)
                 self._notify_status(download)
 
                 # Calculate delay with exponential backoff
@@ -412,7 +417,7 @@ class DownloadManager:
             else:
                 download.status = DownloadStatus.FAILED
                 download.error_message = str(e)
-                self.db.save_download(download)
+                self.db_writer.save_download(download)
                 self._notify_status(download)
 
             await self._start_next_queued()
@@ -462,7 +467,7 @@ class DownloadManager:
         
         # Save periodically (every 5%)
         if download.progress % 5 < 0.1:
-            self.db.save_download(download)
+            self.db_writer.save_download(download)
     
     async def _get_file_info(self, url: str) -> dict:
         """
@@ -498,7 +503,7 @@ class DownloadManager:
                     'content_type': content_type
                 }
         except Exception as e:
-            print(f"Error getting file info: {e}")
+            logger.warning("Error getting file info: %s", e)
             return {}
     
     def _create_segments(self, download: Download) -> List[SegmentInfo]:
@@ -525,9 +530,15 @@ class DownloadManager:
         
         return segments
     
+    def _active_count(self) -> int:
+        """Number of downloads currently downloading"""
+        # Compare the status string directly instead of going through is_active per item
+        downloading = DownloadStatus.DOWNLOADING
+        return sum(1 for d in self.downloads.values() if d.status == downloading)
+
     async def _start_next_queued(self):
         """Start the next queued download if possible"""
-        active_count = sum(1 for d in self.downloads.values() if d.is_active)
+        active_count = self._active_count()
         
         if active_count >= self.max_concurrent:
             return
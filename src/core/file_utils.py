@@ -2,6 +2,7 @@
 File utility functions for download operations
 """
 
+import logging
 import os
 import stat
 import aiofiles
@@ -9,6 +10,9 @@ from pathlib import Path
 from typing import List
 
 
+logger = logging.getLogger(__name__)
+
+
 async def merge_segments(segment_files: List[str], output_file: str, delete_segments: bool = True):
     """
     Merge multiple segment files into a single output file.
@@ -43,7 +47,7 @@ async def merge_segments(segment_files: List[str], output_file: str, delete_segm
     try:
         os.chmod(output_file, 0o600)
     except Exception as e:
-        print(f"Warning: Could not set file permissions: {e}")
+        logger.warning("Could not set file permissions: %s", e)
 
     # Delete segment files
     if delete_segments:
@@ -52,7 +56,7 @@ async def merge_segments(segment_files: List[str], output_file: str, delete_segm
                 if os.path.exists(segment_file):
                     os.remove(segment_file)
             except Exception as e:
-                print(f"Warning: Could not delete segment file {segment_file}: {e}")
+                logger.warning("Could not delete segment file %s: %s", segment_file, e)
 
 
 def create_segment_files(download_id: str, num_segments: int, temp_dir: Path) -> List[str]:
@@ -87,7 +91,7 @@ def cleanup_temp_files(download_id: str, temp_dir: Path):
         for file in temp_dir.glob(f"{download_id}_segment_*.tmp"):
             file.unlink()
     except Exception as e:
-        print(f"Warning: Could not cleanup temp files: {e}")
+        logger.warning("Could not cleanup temp files: %s", e)
 
 
 def get_file_icon_type(filename: str) -> str:
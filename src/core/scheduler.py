@@ -3,11 +3,15 @@ Download scheduler - schedule downloads for specific times
 """
 
 import asyncio
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Callable, List
 from ..models.download import Download
 
 
+logger = logging.getLogger(__name__)
+
+
 class ScheduledDownload:
     """Represents a scheduled download"""
 
@@ -74,7 +78,7 @@ class DownloadScheduler:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"Scheduler error: {e}")
+                logger.error("Scheduler error: %s", e)
                 await asyncio.sleep(self._check_interval)
 
     async def _check_and_start_due(self):
@@ -103,7 +107,7 @@ class DownloadScheduler:
                 # Remove from scheduled after a short delay
                 asyncio.create_task(self._remove_scheduled(download_id))
             except Exception as e:
-                print(f"Failed to start scheduled download {download_id}: {e}")
+                logger.error("Failed to start scheduled download %s: %s", download_id, e)
 
     async def _remove_scheduled(self, download_id: str, delay: float = 5.0):
         """Remove a scheduled download after a delay"""
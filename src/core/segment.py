@@ -5,6 +5,7 @@ Segment downloader - handles downloading a single segment of a file
 import asyncio
 import aiohttp
 import aiofiles
+import logging
 import time
 from pathlib import Path
 from typing import Callable, Optional
@@ -13,6 +14,9 @@ from ..utils.constants import DEFAULT_CHUNK_SIZE, DEFAULT_TIMEOUT, USER_AGENT
 from ..models.download import SegmentInfo
 
 
+logger = logging.getLogger(__name__)
+
+
 class SegmentDownloader:
     """Downloads a single segment of a file using HTTP Range requests"""
 
@@ -108,7 +112,7 @@ class SegmentDownloader:
         except asyncio.CancelledError:
             return False
         except Exception as e:
-            print(f"Segment {self.segment.index} error: {e}")
+            logger.warning("Segment %d error: %s", self.segment.index, e)
             return False
     
     def pause(self):
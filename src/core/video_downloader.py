@@ -107,7 +107,7 @@ class VideoDownloader:
                         }
 
                 except Exception as e:
-                    logger.error(f"Error extracting video info: {e}")
+                    logger.error("Error extracting video info: %s", e)
                     raise
 
         # Run yt-dlp in thread pool to avoid blocking
@@ -240,10 +240,10 @@ class VideoDownloader:
                             try:
                                 progress_callback(progress, downloaded, total, speed)
                             except Exception as e:
-                                logger.error(f"Error in progress callback: {e}")
+                                logger.error("Error in progress callback: %s", e)
 
                 elif d['status'] == 'finished':
-                    logger.info(f"Download finished: {d.get('filename')}")
+                    logger.info("Download finished: %s", d.get('filename'))
 
             # Configure yt-dlp options
             ydl_opts = {
@@ -306,7 +306,7 @@ class VideoDownloader:
                     }
 
                 except Exception as e:
-                    logger.error(f"Error downloading video: {e}")
+                    logger.error("Error downloading video: %s", e)
                     return {
                         'success': False,
                         'filepath': None,
@@ -367,7 +367,7 @@ class VideoDownloader:
                     return videos
 
                 except Exception as e:
-                    logger.error(f"Error extracting playlist: {e}")
+                    logger.error("Error extracting playlist: %s", e)
                     raise
 
         # Run in thread pool
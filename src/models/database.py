@@ -2,16 +2,25 @@
 SQLite database operations for download history and resume data
 """
 
+import logging
+import queue
 import sqlite3
 import json
+import threading
+import time
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from .download import Download, SegmentInfo
 from ..utils.constants import DB_PATH, DownloadStatus
 
 
+logger = logging.getLogger(__name__)
+
+
 class Database:
     """SQLite database handler for downloads"""
     
@@ -79,13 +88,43 @@ class Database:
                 try:
                     cursor.execute(f'ALTER TABLE downloads ADD COLUMN {column} {definition}')
                 except Exception as e:
-                    print(f"Migration warning: Could not add column {column}: {e}")
+                    logger.warning("Migration warning: Could not add column %s: %s", column, e)
+
+    _SAVE_SQL = '''
+        INSERT OR REPLACE INTO downloads
+        (id, url, filename, save_path, total_size, downloaded_size, status,
+         num_segments, error_message, created_at, completed_at, supports_resume,
+         content_type, segments_json, retry_count, checksum, checksum_algorithm, expected_checksum)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
 
     def save_download(self, download: Download):
         """Save or update a download in the database"""
         conn = self._get_connection()
         cursor = conn.cursor()
         
+        cursor.execute(self._SAVE_SQL, self._download_to_row(download))
+        
+        conn.commit()
+        conn.close()
+    
+    _DELETE_SQL = 'DELETE FROM downloads WHERE id = ?'
+
+    def apply_writes(self, ops: List[Tuple[str, tuple]]):
+        """Apply queued ("save", row) / ("delete", (id,)) operations in one transaction"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # Runs of the same kind become one executemany, keeping the overall order
+        for kind, group in groupby(ops, key=itemgetter(0)):
+            sql = self._SAVE_SQL if kind == "save" else self._DELETE_SQL
+            cursor.executemany(sql, [params for _, params in group])
+
+        conn.commit()
+        conn.close()
+
+    def _download_to_row(self, download: Download) -> tuple:
+        """Convert a Download to the parameter tuple for _SAVE_SQL"""
         segments_json = json.dumps([
             {
                 'index': s.index,
@@ -98,13 +137,7 @@ class Database:
             for s in download.segments
         ])
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO downloads
-            (id, url, filename, save_path, total_size, downloaded_size, status,
-             num_segments, error_message, created_at, completed_at, supports_resume,
-             content_type, segments_json, retry_count, checksum, checksum_algorithm, expected_checksum)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        return (
             download.id,
             download.url,
             download.filename,
@@ -123,10 +156,7 @@ class Database:
             download.checksum,
             download.checksum_algorithm,
             download.expected_checksum
-        ))
-        
-        conn.commit()
-        conn.close()
+        )
     
     def get_download(self, download_id: str) -> Optional[Download]:
         """Get a download by ID"""
@@ -318,3 +348,73 @@ class Database:
             checksum_algorithm=row['checksum_algorithm'] if row['checksum_algorithm'] is not None else '',
             expected_checksum=row['expected_checksum'] if row['expected_checksum'] is not None else ''
         )
+
+
+class DatabaseWriter:
+    """
+    Applies database writes on one background thread.
+    Writes arriving within BATCH_WINDOW of each other are committed together.
+    """
+
+    BATCH_WINDOW = 0.02  # seconds
+
+    def __init__(self, db: Database):
+        self._db = db
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def save_download(self, download: Download):
+        """Queue saving a download; its fields are captured now"""
+        self._queue.put(("save", self._db._download_to_row(download)))
+
+    def save_downloads(self, downloads: List[Download]):
+        """Queue saving several downloads"""
+        for download in downloads:
+            self.save_download(download)
+
+    def delete_download(self, download_id: str):
+        """Queue deleting a download"""
+        self._queue.put(("delete", (download_id,)))
+
+    def delete_downloads(self, download_ids: List[str]):
+        """Queue deleting several downloads"""
+        for download_id in download_ids:
+            self.delete_download(download_id)
+
+    def flush(self):
+        """Block until every queued write is committed; no-op once closed"""
+        if not self._closed:
+            self._queue.join()
+
+    def close(self):
+        """Commit the remaining writes and stop the thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Drain the queue in batches until closed"""
+        running = True
+        while running:
+            ops = [self._queue.get()]
+            time.sleep(self.BATCH_WINDOW)  # Let a burst pile up
+            while True:
+                try:
+                    ops.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in ops:
+                running = False
+            writes = [op for op in ops if op is not None]
+            try:
+                if writes:
+                    self._db.apply_writes(writes)
+            except Exception:
+                logger.exception("Failed to write %d queued database operations", len(writes))
+            finally:
+                for _ in ops:
+                    self._queue.task_done()
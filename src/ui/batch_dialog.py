@@ -31,6 +31,14 @@ class BatchImportDialog(QDialog):
 
         self._setup_ui()
 
+    def reset(self):
+        """Restore default field values so a cached dialog can be shown again"""
+        self.urls_text.clear()
+        self.category_combo.setCurrentIndex(0)
+        self.save_path_input.setText(DEFAULT_DOWNLOAD_DIR)
+        self.segments_spin.setValue(DEFAULT_SEGMENTS)
+        self.urls_text.setFocus()
+
     def _setup_ui(self):
         """Set up the dialog UI"""
         layout = QVBoxLayout(self)
@@ -3,13 +3,15 @@ New download dialog - for adding new downloads
 """
 
 import os
-from pathlib import Path
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFileDialog, QSpinBox, QGroupBox, QFormLayout,
-    QMessageBox, QCheckBox, QDateTimeEdit
+    QMessageBox, QCheckBox, QDateTimeEdit, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDateTime
+from PyQt6.QtCore import Qt, pyqtSignal, QDateTime, QThreadPool
 from PyQt6.QtGui import QFont
 
 from ..utils.constants import DEFAULT_DOWNLOAD_DIR, DEFAULT_SEGMENTS
@@ -19,15 +21,36 @@ from ..utils.video_sites import is_video_url, is_playlist_url, get_video_site_na
 from .settings_dialog import StyledSpinBox
 
 
+def _is_valid_save_dir(path: str) -> bool:
+    """Check if a directory exists, or its parent does (category subfolders are created later)"""
+    parent_dir = os.path.dirname(path)
+    return os.path.isdir(path) or os.path.isdir(parent_dir) or parent_dir == path
+
+
+@dataclass
+class DownloadRequest:
+    """Download parameters collected by the dialog"""
+    url: str
+    save_dir: str
+    num_segments: int
+    category: str
+    scheduled_time: Optional[datetime] = None
+    expected_checksum: str = ""
+    checksum_algorithm: str = ""
+
+
 class DownloadDialog(QDialog):
     """Dialog for adding a new download"""
 
     # Signal emitted when download is confirmed
-    download_requested = pyqtSignal(str, str, int, str, object, str, str)  # url, save_dir, num_segments, category, scheduled_time, expected_checksum, checksum_algorithm
+    download_requested = pyqtSignal(object)  # DownloadRequest
 
     # Signal emitted when video download is requested
     video_download_requested = pyqtSignal(str, str, str)  # url, save_dir, category
 
+    # Internal: result of a background save path check
+    _path_checked = pyqtSignal(str, bool)  # path, valid
+
     def __init__(self, parent=None, url: str = ""):
         super().__init__(parent)
         self.setWindowTitle("Add New Download")
@@ -35,10 +58,32 @@ class DownloadDialog(QDialog):
         self.setModal(True)
         
         self._initial_url = url
+        self._last_validated_url: Optional[str] = None
+        self._path_valid: Dict[str, bool] = {}  # save path -> result of background check
+        self._path_checked.connect(self._on_path_checked)
         self._setup_ui()
         
         if url:
             self.url_input.setText(url)
+
+    def reset(self, url: str = ""):
+        """Restore default field values so a cached dialog can be shown again"""
+        # Drives come and go between opens, so check every path again
+        self._path_valid.clear()
+        self.category_combo.setCurrentIndex(0)
+        self.save_path_input.setText(DEFAULT_DOWNLOAD_DIR)
+        self.segments_spin.setValue(DEFAULT_SEGMENTS)
+        self.schedule_cb.setChecked(False)
+        now = QDateTime.currentDateTime()
+        self.schedule_datetime.setMinimumDateTime(now)
+        self.schedule_datetime.setDateTime(now.addSecs(3600))
+        self.verify_checksum_cb.setChecked(False)
+        self.checksum_algo_combo.setCurrentIndex(0)
+        self.checksum_input.clear()
+        # Clear first so the same URL is re-validated and its category re-detected
+        self.url_input.clear()
+        self.url_input.setText(url)
+        self.url_input.setFocus()
     
     def _setup_ui(self):
         """Set up the dialog UI"""
@@ -79,9 +124,9 @@ class DownloadDialog(QDialog):
         category_label = QLabel("Category:")
         category_row.addWidget(category_label)
 
-        from PyQt6.QtWidgets import QComboBox
         self.category_combo = QComboBox()
-        for key, category in get_all_categories().items():
+        self._categories = get_all_categories()
+        for key, category in self._categories.items():
             self.category_combo.addItem(category.name, key)
         # Set "Auto" as default (first item)
         self.category_combo.setCurrentIndex(0)
@@ -95,6 +140,8 @@ class DownloadDialog(QDialog):
         self.save_path_input = QLineEdit()
         self.save_path_input.setText(DEFAULT_DOWNLOAD_DIR)
         self.save_path_input.setReadOnly(True)
+        self.save_path_input.textChanged.connect(self._prevalidate_path)
+        self._prevalidate_path(self.save_path_input.text())
         path_row.addWidget(self.save_path_input)
 
         browse_btn = QPushButton("Browse...")
@@ -179,6 +226,11 @@ class DownloadDialog(QDialog):
         """Handle URL text change - validate and auto-detect category"""
         url = self.url_input.text().strip()
 
+        # Nothing to do if the URL hasn't changed since the last validation
+        if url == self._last_validated_url:
+            return
+        self._last_validated_url = url
+
         if not url:
             self.url_status.setText("Enter a download URL")
             self.url_status.setStyleSheet("color: #888; font-size: 11px;")
@@ -261,9 +313,9 @@ class DownloadDialog(QDialog):
         # Update path to include category subfolder
         # Get base path (remove existing category folder if any)
         base_path = current_path
-        for category in get_all_categories().values():
+        for category in self._categories.values():
             if category.folder_name and base_path.endswith(category.folder_name):
-                base_path = str(Path(base_path).parent.parent)
+                base_path = os.path.dirname(os.path.dirname(base_path))
                 break
 
         new_path = get_category_save_path(base_path, category_key)
@@ -279,6 +331,25 @@ class DownloadDialog(QDialog):
         if folder:
             self.save_path_input.setText(folder)
     
+    def _prevalidate_path(self, path: str):
+        """Check the save path on a worker thread so slow drives don't block the UI"""
+        path = path.strip()
+        if not path or path in self._path_valid:
+            return
+        QThreadPool.globalInstance().start(lambda: self._check_path(path))
+
+    def _check_path(self, path: str):
+        """Worker thread: stat the path and report back to the dialog"""
+        valid = _is_valid_save_dir(path)
+        try:
+            self._path_checked.emit(path, valid)
+        except RuntimeError:
+            pass  # Dialog was destroyed before the check finished
+
+    def _on_path_checked(self, path: str, valid: bool):
+        """Store the result of a background path check"""
+        self._path_valid[path] = valid
+
     def _on_download_click(self):
         """Handle download button click"""
         url = self.url_input.text().strip()
@@ -292,13 +363,13 @@ class DownloadDialog(QDialog):
             return
 
         # Validate path - check if directory exists or if parent directory exists (for category subfolders)
-        if not os.path.isdir(save_dir):
-            # Check if it's a category subfolder that doesn't exist yet
-            # If parent directory exists, that's okay - we'll create the subfolder when downloading
-            parent_dir = str(Path(save_dir).parent)
-            if not os.path.isdir(parent_dir) and parent_dir != save_dir:
-                QMessageBox.warning(self, "Invalid Path", "The save location does not exist.")
-                return
+        # Use the background check result; only stat here if it hasn't reported yet
+        valid = self._path_valid.get(save_dir)
+        if valid is None:
+            valid = _is_valid_save_dir(save_dir)
+        if not valid:
+            QMessageBox.warning(self, "Invalid Path", "The save location does not exist.")
+            return
 
         # Check if this is a video URL
         if is_video_url(url):
@@ -324,7 +395,15 @@ class DownloadDialog(QDialog):
             scheduled_time = self.schedule_datetime.dateTime().toPyDateTime()
 
         # Emit signal and close
-        self.download_requested.emit(url, save_dir, num_segments, category, scheduled_time, expected_checksum, checksum_algorithm)
+        self.download_requested.emit(DownloadRequest(
+            url=url,
+            save_dir=save_dir,
+            num_segments=num_segments,
+            category=category,
+            scheduled_time=scheduled_time,
+            expected_checksum=expected_checksum,
+            checksum_algorithm=checksum_algorithm
+        ))
         self.accept()
     
     def get_download_info(self) -> tuple:
@@ -2,12 +2,15 @@
 Download item widget - displays a single download in the list
 """
 
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
 from PyQt6.QtWidgets import (
     QWidget, QFrame, QHBoxLayout, QVBoxLayout, QLabel,
     QPushButton, QProgressBar, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QIcon
 
 try:
     import qtawesome as qta
@@ -18,7 +21,99 @@ except ImportError:
 from ..models.download import Download
 from ..utils.constants import DownloadStatus
 from ..utils.helpers import format_size, format_speed, format_time
-from .styles import get_status_color
+
+# Button icons are rendered once and shared by all download items
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+
+def _icon(name: str) -> QIcon:
+    """Get a cached QtAwesome button icon"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = qta.icon(name, color='#eaeaea')
+    return icon
+
+
+# Every icon a download row can show
+_ICON_NAMES = (
+    'fa5s.pause', 'fa5s.play', 'fa5s.times', 'fa5s.file',
+    'fa5s.folder-open', 'fa5s.trash-alt', 'fa5s.redo',
+)
+
+
+def warm_icon_cache():
+    """Build all download row icons ahead of the first row being shown"""
+    if HAS_QTAWESOME:
+        for name in _ICON_NAMES:
+            _icon(name)
+
+
+# Separator between the parts of a status line
+_STATUS_SEP = "  •  "
+
+
+@lru_cache(maxsize=1024)
+def _size_progress_text(downloaded: int, total: int) -> str:
+    """'downloaded / total' text, cached per (bucketed) byte pair"""
+    return f"{format_size(downloaded)} / {format_size(total)}"
+
+
+@lru_cache(maxsize=1024)
+def _eta_text(eta: int) -> str:
+    """'ETA: ...' text, cached per second value"""
+    return "ETA: " + (format_time(eta) if eta >= 0 else "∞")
+
+
+def _status_text_downloading(download: Download) -> Tuple[str, str]:
+    """Status text while downloading"""
+    # Bucketize the downloaded size (64 KB) so the cached formatter hits; the
+    # speed is shown as measured
+    downloaded = download.downloaded_size & ~0xFFFF or download.downloaded_size
+    speed_text = format_speed(download.speed) if download.speed > 0 else "calculating..."
+    return _STATUS_SEP.join((
+        _size_progress_text(downloaded, download.total_size),
+        speed_text,
+        _eta_text(download.eta),
+    )), ""
+
+
+def _status_text_completed(download: Download) -> Tuple[str, str]:
+    """Status text for a completed download"""
+    return "✓ Completed" + _STATUS_SEP + format_size(download.total_size), ""
+
+
+def _status_text_paused(download: Download) -> Tuple[str, str]:
+    """Status text for a paused download"""
+    return "⏸ Paused" + _STATUS_SEP + _size_progress_text(download.downloaded_size, download.total_size), ""
+
+
+def _status_text_queued(download: Download) -> Tuple[str, str]:
+    """Status text for a queued download"""
+    return "⏳ Waiting in queue...", ""
+
+
+def _status_text_failed(download: Download) -> Tuple[str, str]:
+    """Status text for a failed download"""
+    error = download.error_message or "Unknown error"
+    # Truncate very long error messages and show full text in tooltip
+    if len(error) > 100:
+        return f"✕ Failed: {error[:97]}...", f"✕ Failed: {error}"
+    return f"✕ Failed: {error}", ""
+
+
+def _status_text_default(download: Download) -> Tuple[str, str]:
+    """Status text for any other status"""
+    return download.status.capitalize(), ""
+
+
+# Status -> (label text, tooltip) formatter, looked up once per refresh
+_STATUS_TEXT_FORMATTERS = {
+    DownloadStatus.DOWNLOADING: _status_text_downloading,
+    DownloadStatus.COMPLETED: _status_text_completed,
+    DownloadStatus.PAUSED: _status_text_paused,
+    DownloadStatus.QUEUED: _status_text_queued,
+    DownloadStatus.FAILED: _status_text_failed,
+}
 
 
 class DownloadItemWidget(QFrame):
@@ -31,16 +126,29 @@ class DownloadItemWidget(QFrame):
     open_file_clicked = pyqtSignal(str)  # download_id
     open_folder_clicked = pyqtSignal(str)  # download_id
     
+    HEIGHT = 120  # Fixed row height; the download list lays rows out by it
+    
+    # Shared filename font, created on first use (needs a QApplication)
+    _filename_font: Optional[QFont] = None
+    
     def __init__(self, download: Download, parent=None):
         super().__init__(parent)
         self.download = download
         self.setObjectName("downloadItemFrame")
+        self._update_pending = False
+        self._stale = False
+        self._last_chunk_status = None
+        self._last_progress = -1
+        self._last_filename = None
+        self._last_status = None
+        self._last_status_text = ""
+        self._last_status_tooltip = ""
         self._setup_ui()
         self._update_display()
     
     def _setup_ui(self):
         """Set up the user interface"""
-        self.setFixedHeight(120)  # Increased height
+        self.setFixedHeight(self.HEIGHT)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         
         # Main layout
@@ -55,10 +163,12 @@ class DownloadItemWidget(QFrame):
         # Filename
         self.filename_label = QLabel(self.download.filename)
         self.filename_label.setObjectName("filenameLabel")
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(11)
-        self.filename_label.setFont(font)
+        if DownloadItemWidget._filename_font is None:
+            font = QFont()
+            font.setBold(True)
+            font.setPointSize(11)
+            DownloadItemWidget._filename_font = font
+        self.filename_label.setFont(DownloadItemWidget._filename_font)
         self.filename_label.setWordWrap(True)
         left_layout.addWidget(self.filename_label)
         
@@ -109,34 +219,60 @@ class DownloadItemWidget(QFrame):
         
         main_layout.addLayout(button_layout)
     
+    def set_download(self, download: Download):
+        """Rebind the widget to another download and refresh immediately"""
+        self.download = download
+        self._stale = False
+        self._update_display()
+    
     def update_download(self, download: Download):
-        """Update the download data and refresh display"""
+        """Update the download data and schedule a display refresh"""
         self.download = download
+        # Coalesce bursts of updates into a single refresh on the next event loop turn
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_update)
+    
+    def _flush_update(self):
+        """Refresh the display once for all updates since it was scheduled"""
+        self._update_pending = False
+        # Rows scrolled out of the viewport (or in a hidden window) are refreshed
+        # when they are next painted instead of on every progress tick
+        if self.visibleRegion().isEmpty():
+            self._stale = True
+            return
+        self._stale = False
         self._update_display()
     
+    def paintEvent(self, event):
+        """Bring a stale row up to date once it becomes visible again"""
+        super().paintEvent(event)
+        if self._stale and not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_update)
+    
     def _update_display(self):
         """Update all display elements based on current download state"""
-        # Update filename
-        self.filename_label.setText(self.download.filename)
+        # Update filename (rarely changes after creation)
+        if self.download.filename != self._last_filename:
+            self.filename_label.setText(self.download.filename)
+            self._last_filename = self.download.filename
         
-        # Update progress bar
+        # Update progress bar only when the whole percent changes
         progress = int(self.download.progress)
-        self.progress_bar.setValue(progress)
+        if progress != self._last_progress:
+            self.progress_bar.setValue(progress)
+            self._last_progress = progress
         
-        # Set progress bar color based on status
-        status_color = get_status_color(self.download.status)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: #16213e;
-                border: none;
-                border-radius: 8px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {status_color};
-                border-radius: 8px;
-            }}
-        """)
+        # Progress bar color comes from the theme's QProgressBar[status=...] rules;
+        # re-polish only when the status property actually changes
+        status = self.download.status
+        if status != self._last_chunk_status:
+            self.progress_bar.setProperty("status", status)
+            style = self.progress_bar.style()
+            style.unpolish(self.progress_bar)
+            style.polish(self.progress_bar)
+            self._last_chunk_status = status
         
         # Update status label
         self._update_status_label()
@@ -147,102 +283,63 @@ class DownloadItemWidget(QFrame):
     def _update_status_label(self):
         """Update the status label text"""
         status = self.download.status
-        
-        if status == DownloadStatus.DOWNLOADING:
-            size_text = f"{format_size(self.download.downloaded_size)} / {format_size(self.download.total_size)}"
-            speed_text = format_speed(self.download.speed) if self.download.speed > 0 else "calculating..."
-            eta_text = format_time(self.download.eta) if self.download.eta >= 0 else "∞"
-            self.status_label.setText(f"{size_text}  •  {speed_text}  •  ETA: {eta_text}")
-            
-        elif status == DownloadStatus.COMPLETED:
-            self.status_label.setText(f"✓ Completed  •  {format_size(self.download.total_size)}")
-            
-        elif status == DownloadStatus.PAUSED:
-            size_text = f"{format_size(self.download.downloaded_size)} / {format_size(self.download.total_size)}"
-            self.status_label.setText(f"⏸ Paused  •  {size_text}")
-            
-        elif status == DownloadStatus.QUEUED:
-            self.status_label.setText("⏳ Waiting in queue...")
-            
-        elif status == DownloadStatus.FAILED:
-            error = self.download.error_message or "Unknown error"
-            # Truncate very long error messages and show full text in tooltip
-            if len(error) > 100:
-                short_error = error[:97] + "..."
-                self.status_label.setText(f"✕ Failed: {short_error}")
-                self.status_label.setToolTip(f"✕ Failed: {error}")
-            else:
-                self.status_label.setText(f"✕ Failed: {error}")
-                self.status_label.setToolTip("")
-            
-        else:
-            self.status_label.setText(status.capitalize())
+        text, tooltip = _STATUS_TEXT_FORMATTERS.get(status, _status_text_default)(self.download)
+        # Skip setText (and the relayout it triggers) when nothing changed
+        if text != self._last_status_text:
+            self.status_label.setText(text)
+            self._last_status_text = text
+        if tooltip != self._last_status_tooltip:
+            self.status_label.setToolTip(tooltip)
+            self._last_status_tooltip = tooltip
+    
+    # Status -> (pause/resume text, icon, action text, icon, show folder); action text None hides it
+    _BUTTON_CONFIG = {
+        DownloadStatus.DOWNLOADING: (" Pause", 'fa5s.pause', " Cancel", 'fa5s.times', False),
+        DownloadStatus.PAUSED: (" Resume", 'fa5s.play', " Cancel", 'fa5s.times', False),
+        DownloadStatus.COMPLETED: (" Open", 'fa5s.file', None, None, True),
+        DownloadStatus.QUEUED: (" Start", 'fa5s.play', " Remove", 'fa5s.trash-alt', False),
+        DownloadStatus.FAILED: (" Retry", 'fa5s.redo', " Remove", 'fa5s.trash-alt', False),
+    }
     
     def _update_buttons(self):
         """Update button states based on download status"""
         status = self.download.status
+        if status == self._last_status:
+            return
+        self._last_status = status
         
-        if status == DownloadStatus.DOWNLOADING:
-            self.pause_resume_btn.setText(" Pause")
-            if HAS_QTAWESOME:
-                self.pause_resume_btn.setIcon(qta.icon('fa5s.pause', color='#eaeaea'))
-            self.pause_resume_btn.show()
-            self.action_btn.setText(" Cancel")
-            if HAS_QTAWESOME:
-                self.action_btn.setIcon(qta.icon('fa5s.times', color='#eaeaea'))
-            self.action_btn.show()
-            self.open_folder_btn.hide()
-            
-        elif status == DownloadStatus.PAUSED:
-            self.pause_resume_btn.setText(" Resume")
-            if HAS_QTAWESOME:
-                self.pause_resume_btn.setIcon(qta.icon('fa5s.play', color='#eaeaea'))
-            self.pause_resume_btn.show()
-            self.action_btn.setText(" Cancel")
+        config = self._BUTTON_CONFIG.get(status)
+        if config is None:
+            return
+        pr_text, pr_icon, act_text, act_icon, show_folder = config
+        
+        self.pause_resume_btn.setText(pr_text)
+        if HAS_QTAWESOME:
+            self.pause_resume_btn.setIcon(_icon(pr_icon))
+        self.pause_resume_btn.show()
+        
+        if act_text is None:
+            self.action_btn.hide()
+        else:
+            self.action_btn.setText(act_text)
             if HAS_QTAWESOME:
-                self.action_btn.setIcon(qta.icon('fa5s.times', color='#eaeaea'))
+                self.action_btn.setIcon(_icon(act_icon))
             self.action_btn.show()
-            self.open_folder_btn.hide()
-            
-        elif status == DownloadStatus.COMPLETED:
-            self.pause_resume_btn.setText(" Open")
-            if HAS_QTAWESOME:
-                self.pause_resume_btn.setIcon(qta.icon('fa5s.file', color='#eaeaea'))
-            self.pause_resume_btn.show()
-            self.action_btn.hide()
+        
+        if show_folder:
             self.open_folder_btn.setText(" Folder")
             if HAS_QTAWESOME:
-                self.open_folder_btn.setIcon(qta.icon('fa5s.folder-open', color='#eaeaea'))
+                self.open_folder_btn.setIcon(_icon('fa5s.folder-open'))
             self.open_folder_btn.show()
-            
-        elif status == DownloadStatus.QUEUED:
-            self.pause_resume_btn.setText(" Start")
-            if HAS_QTAWESOME:
-                self.pause_resume_btn.setIcon(qta.icon('fa5s.play', color='#eaeaea'))
-            self.pause_resume_btn.show()
-            self.action_btn.setText(" Remove")
-            if HAS_QTAWESOME:
-                self.action_btn.setIcon(qta.icon('fa5s.trash-alt', color='#eaeaea'))
-            self.action_btn.show()
-            self.open_folder_btn.hide()
-            
-        elif status == DownloadStatus.FAILED:
-            self.pause_resume_btn.setText(" Retry")
-            if HAS_QTAWESOME:
-                self.pause_resume_btn.setIcon(qta.icon('fa5s.redo', color='#eaeaea'))
-            self.pause_resume_btn.show()
-            self.action_btn.setText(" Remove")
-            if HAS_QTAWESOME:
-                self.action_btn.setIcon(qta.icon('fa5s.trash-alt', color='#eaeaea'))
-            self.action_btn.show()
+        else:
             self.open_folder_btn.hide()
     
     def _update_button_icons(self):
         """Set initial button icons"""
         if HAS_QTAWESOME:
-            self.pause_resume_btn.setIcon(qta.icon('fa5s.pause', color='#eaeaea'))
-            self.action_btn.setIcon(qta.icon('fa5s.times', color='#eaeaea'))
-            self.open_folder_btn.setIcon(qta.icon('fa5s.folder-open', color='#eaeaea'))
+            self.pause_resume_btn.setIcon(_icon('fa5s.pause'))
+            self.action_btn.setIcon(_icon('fa5s.times'))
+            self.open_folder_btn.setIcon(_icon('fa5s.folder-open'))
     
     def _on_pause_resume_click(self):
         """Handle pause/resume button click"""
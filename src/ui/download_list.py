@@ -0,0 +1,151 @@
+"""
+Virtualized download list - only rows inside the viewport get a widget
+"""
+
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import QScrollArea, QWidget, QFrame
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+
+from ..models.download import Download
+from .download_item import DownloadItemWidget
+
+
+class DownloadListView(QScrollArea):
+    """Scrollable list of downloads that mounts pooled item widgets for visible rows"""
+
+    # Signals (forwarded from the pooled item widgets)
+    pause_clicked = pyqtSignal(str)    # download_id
+    resume_clicked = pyqtSignal(str)   # download_id
+    cancel_clicked = pyqtSignal(str)   # download_id
+    open_file_clicked = pyqtSignal(str)  # download_id
+    open_folder_clicked = pyqtSignal(str)  # download_id
+
+    ROW_HEIGHT = DownloadItemWidget.HEIGHT
+    ROW_SPACING = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._downloads: List[Download] = []  # Newest first
+        self._rows: Optional[Dict[str, int]] = {}  # download_id -> row, None when stale
+        self._rebuild_pending = False
+        self._mounted: Dict[int, DownloadItemWidget] = {}  # row -> widget
+        self._pool: List[DownloadItemWidget] = []
+
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+
+        self._container = QWidget()
+        self.setWidget(self._container)
+
+        self.verticalScrollBar().valueChanged.connect(self._layout_rows)
+
+    def add_download(self, download: Download):
+        """Add a download at the top of the list"""
+        row = self._row_of(download.id)
+        if row is not None:
+            self._downloads.pop(row)
+        self._downloads.insert(0, download)
+        self._invalidate()
+
+    def remove_download(self, download_id: str):
+        """Remove a download from the list"""
+        self.remove_downloads([download_id])
+
+    def remove_downloads(self, download_ids: List[str]):
+        """Remove several downloads with a single re-index"""
+        ids = set(download_ids)
+        remaining = [download for download in self._downloads if download.id not in ids]
+        if len(remaining) != len(self._downloads):
+            self._downloads = remaining
+            self._invalidate()
+
+    def update_download(self, download: Download):
+        """Update a download; only a mounted row touches its widget"""
+        row = self._row_of(download.id)
+        if row is None:
+            return
+        self._downloads[row] = download
+        widget = self._mounted.get(row)
+        if widget is not None:
+            widget.update_download(download)
+
+    def contains(self, download_id: str) -> bool:
+        """Check if a download is in the list"""
+        return self._row_of(download_id) is not None
+
+    def count(self) -> int:
+        """Number of downloads in the list"""
+        return len(self._downloads)
+
+    def _row_of(self, download_id: str) -> Optional[int]:
+        """Row of a download, re-indexing lazily after inserts/removes"""
+        if self._rows is None:
+            self._rows = {download.id: row for row, download in enumerate(self._downloads)}
+        return self._rows.get(download_id)
+
+    def _invalidate(self):
+        """Drop the row index and schedule one re-layout for a burst of changes"""
+        self._rows = None
+        # Row indices shifted, so every mounted widget goes back to the pool
+        for widget in self._mounted.values():
+            widget.hide()
+            self._pool.append(widget)
+        self._mounted.clear()
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            QTimer.singleShot(0, self._rebuild)
+
+    def _rebuild(self):
+        """Resize the container and re-mount the visible rows"""
+        self._rebuild_pending = False
+        count = len(self._downloads)
+        stride = self.ROW_HEIGHT + self.ROW_SPACING
+        self._container.setMinimumHeight(max(0, count * stride - self.ROW_SPACING))
+        self._layout_rows()
+
+    def _layout_rows(self):
+        """Mount widgets for the rows intersecting the viewport and release the rest"""
+        stride = self.ROW_HEIGHT + self.ROW_SPACING
+        top = self.verticalScrollBar().value()
+        height = self.viewport().height()
+        first = top // stride
+        last = min(len(self._downloads) - 1, (top + height) // stride)
+        visible = range(first, last + 1)
+
+        # Release rows that scrolled out
+        for row in [row for row in self._mounted if row not in visible]:
+            widget = self._mounted.pop(row)
+            widget.hide()
+            self._pool.append(widget)
+
+        # Mount rows that scrolled in
+        width = self._container.width()
+        for row in visible:
+            widget = self._mounted.get(row)
+            if widget is None:
+                widget = self._acquire(self._downloads[row])
+                self._mounted[row] = widget
+            widget.setGeometry(0, row * stride, width, self.ROW_HEIGHT)
+            widget.show()
+
+    def _acquire(self, download: Download) -> DownloadItemWidget:
+        """Take a widget from the pool (or create one) bound to a download"""
+        if self._pool:
+            widget = self._pool.pop()
+            widget.set_download(download)
+            return widget
+
+        widget = DownloadItemWidget(download, self._container)
+        widget.pause_clicked.connect(self.pause_clicked)
+        widget.resume_clicked.connect(self.resume_clicked)
+        widget.cancel_clicked.connect(self.cancel_clicked)
+        widget.open_file_clicked.connect(self.open_file_clicked)
+        widget.open_folder_clicked.connect(self.open_folder_clicked)
+        return widget
+
+    def resizeEvent(self, event):
+        """Re-layout rows for the new viewport size"""
+        super().resizeEvent(event)
+        self._layout_rows()
@@ -2,22 +2,160 @@
 Download history view widget
 """
 
-from typing import Optional, List
+from functools import partial
+from typing import Dict, Optional, List, Set, Tuple
 from datetime import datetime, timedelta
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
+    QPushButton, QComboBox, QTableView, QAbstractItemView,
     QHeaderView, QMessageBox, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont, QBrush
 
 from ..models.download import Download
 from ..utils.helpers import format_size
 from ..utils.constants import DownloadStatus
 
 
+# Foreground brushes and styles built once and shared by every row
+_BRUSH_GREEN = QBrush(Qt.GlobalColor.green)
+_BRUSH_RED = QBrush(Qt.GlobalColor.red)
+_BRUSH_GRAY = QBrush(Qt.GlobalColor.gray)
+
+_STATUS_BRUSHES = {
+    DownloadStatus.COMPLETED: _BRUSH_GREEN,
+    DownloadStatus.FAILED: _BRUSH_RED,
+    DownloadStatus.CANCELLED: _BRUSH_GRAY,
+}
+
+_STATUS_LABEL_STYLE = "color: #888; font-size: 11px;"
+
+# Status values bound at module level so per-row code skips the class attribute lookup.
+# Statuses are plain strings (stored as TEXT in the database), so compare with ==.
+_COMPLETED = DownloadStatus.COMPLETED
+
+
+class DownloadHistoryModel(QAbstractTableModel):
+    """Table model over the filtered history; rows are formatted on first display"""
+
+    HEADERS = ["Filename", "Status", "Size", "Date", "Speed", "Error", "Checksum"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Download] = []
+        self._display_cache: Dict[str, Tuple[str, ...]] = {}
+
+    def set_rows(self, rows: List[Download]):
+        """Replace the displayed rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def clear_cache(self):
+        """Drop all cached display texts"""
+        self._display_cache.clear()
+
+    def remove_downloads(self, download_ids: Set[str]):
+        """Remove the rows of the given downloads"""
+        rows = [row for row, shown in enumerate(self._rows) if shown.id in download_ids]
+        if not rows:
+            return
+        for download_id in download_ids:
+            self._display_cache.pop(download_id, None)
+        if len(rows) == 1:
+            # A single delete only shifts the rows below it
+            self.beginRemoveRows(QModelIndex(), rows[0], rows[0])
+            del self._rows[rows[0]]
+            self.endRemoveRows()
+        else:
+            self.set_rows([shown for shown in self._rows if shown.id not in download_ids])
+
+    def download_at(self, row: int) -> Optional[Download]:
+        """Get the download shown in a row"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows"""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column titles"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Cell text and foreground for a visible row"""
+        if not index.isValid():
+            return None
+        download = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_texts(download)[col]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._cell_brush(download, col)
+        return None
+
+    def _display_texts(self, download: Download) -> Tuple[str, ...]:
+        """Formatted texts for a row, computed once per download and cached"""
+        texts = self._display_cache.get(download.id)
+        if texts is not None:
+            return texts
+
+        # Speed (for completed downloads)
+        if download.status == _COMPLETED and download.speed > 0:
+            speed_text = f"{download.speed / 1024 / 1024:.1f} MB/s"
+        else:
+            speed_text = "N/A"
+
+        # Error message (for failed downloads)
+        error = download.error_message
+        error_text = error[:50] + "..." if len(error) > 50 else error
+
+        # Checksum status
+        if download.checksum:
+            checksum_text = f"✓ {download.checksum_algorithm.upper()}"
+        elif download.expected_checksum:
+            checksum_text = "✗ Failed"
+        else:
+            checksum_text = ""
+
+        texts = (
+            download.filename,
+            download.status.capitalize(),
+            format_size(download.total_size) if download.total_size > 0 else "N/A",
+            download.created_at.strftime("%Y-%m-%d %H:%M"),
+            speed_text,
+            error_text,
+            checksum_text,
+        )
+        self._display_cache[download.id] = texts
+        return texts
+
+    def _cell_brush(self, download: Download, col: int) -> Optional[QBrush]:
+        """Foreground brush for one cell, or None for the default"""
+        if col == 1:
+            return _STATUS_BRUSHES.get(download.status)
+        elif col == 5:
+            if download.error_message:
+                return _BRUSH_RED
+        elif col == 6:
+            if download.checksum:
+                return _BRUSH_GREEN
+            if download.expected_checksum:
+                return _BRUSH_RED
+        return None
+
+
 class HistoryViewWidget(QWidget):
     """Widget for displaying download history"""
 
@@ -25,12 +163,16 @@ class HistoryViewWidget(QWidget):
     open_file_requested = pyqtSignal(str)  # download_id
     open_folder_requested = pyqtSignal(str)  # download_id
     delete_requested = pyqtSignal(str)  # download_id
+    delete_many_requested = pyqtSignal(list)  # download_ids
     retry_requested = pyqtSignal(str)  # download_id
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._downloads: List[Download] = []
         self._filtered_downloads: List[Download] = []
+        self._search_keys: List[str] = []
+        self._match_indices: List[int] = []
+        self._last_query: Optional[Tuple[str, str]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -51,6 +193,12 @@ class HistoryViewWidget(QWidget):
         self.search_input.textChanged.connect(self._on_search_changed)
         filter_layout.addWidget(self.search_input)
 
+        # Debounce search so a burst of keystrokes triggers a single filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_filters)
+
         # Status filter
         self.status_filter = QComboBox()
         self.status_filter.addItem("All Status", "all")
@@ -68,16 +216,14 @@ class HistoryViewWidget(QWidget):
         layout.addLayout(filter_layout)
 
         # History table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Filename", "Status", "Size", "Date", "Speed", "Error", "Checksum"
-        ])
+        self._model = DownloadHistoryModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
 
         # Configure table
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
@@ -86,108 +232,83 @@ class HistoryViewWidget(QWidget):
         # Set column widths
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Filename
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Status
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Size
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Date
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Speed
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Error
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # Checksum
+        # Status, Size, Date, Speed, Error and Checksum are sized to contents once per
+        # filter pass in _update_table rather than re-measured on every model change
+        for col in range(1, 7):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
 
         self.table.customContextMenuRequested.connect(self._show_context_menu)
+        self._context_menu = QMenu(self)
 
         layout.addWidget(self.table)
 
         # Status label
         self.status_label = QLabel("No downloads in history")
-        self.status_label.setStyleSheet("color: #888; font-size: 11px;")
+        self.status_label.setStyleSheet(_STATUS_LABEL_STYLE)
         layout.addWidget(self.status_label)
 
     def set_downloads(self, downloads: List[Download]):
         """Set the downloads to display"""
         self._downloads = downloads
+        # Lowercased search keys, built once per data set rather than per keystroke.
+        # Filename and URL are joined so each row needs a single substring test;
+        # the separator cannot appear in a single-line search query.
+        self._search_keys = [f"{d.filename}\n{d.url}".lower() for d in downloads]
+        self._last_query = None
+        self._model.clear_cache()
         self._apply_filters()
 
+    def remove_downloads(self, download_ids: List[str]):
+        """Remove downloads from the history without reloading the rest"""
+        ids = set(download_ids)
+        kept = [i for i, download in enumerate(self._downloads) if download.id not in ids]
+        if len(kept) == len(self._downloads):
+            return
+        self._downloads = [self._downloads[i] for i in kept]
+        self._search_keys = [self._search_keys[i] for i in kept]
+        # Match indices point into the old list, so the next filter pass starts over
+        self._last_query = None
+        self._filtered_downloads = [d for d in self._filtered_downloads if d.id not in ids]
+        self._model.remove_downloads(ids)
+        self._update_status_label()
+
     def _apply_filters(self):
         """Apply search and status filters"""
         search_text = self.search_input.text().strip().lower()
         status_filter = self.status_filter.currentData()
 
-        # Filter downloads
-        filtered = []
-        for download in self._downloads:
-            # Status filter
-            if status_filter != "all" and download.status != status_filter:
-                continue
-
-            # Search filter
-            if search_text:
-                if (search_text not in download.filename.lower() and
-                    search_text not in download.url.lower()):
-                    continue
-
-            filtered.append(download)
-
-        self._filtered_downloads = filtered
+        # When the query only got longer, matches must come from the previous matches
+        last = self._last_query
+        if last is not None and last[0] == status_filter and last[1] in search_text:
+            candidates = self._match_indices
+        else:
+            candidates = range(len(self._downloads))
+
+        downloads = self._downloads
+        keys = self._search_keys
+        if status_filter != "all":
+            candidates = [i for i in candidates if downloads[i].status == status_filter]
+        if search_text:
+            candidates = [i for i in candidates if search_text in keys[i]]
+
+        self._match_indices = list(candidates)
+        self._last_query = (status_filter, search_text)
+        self._filtered_downloads = [downloads[i] for i in self._match_indices]
         self._update_table()
 
     def _update_table(self):
         """Update the table with filtered downloads"""
-        self.table.setRowCount(len(self._filtered_downloads))
-
-        for row, download in enumerate(self._filtered_downloads):
-            # Filename
-            filename_item = QTableWidgetItem(download.filename)
-            self.table.setItem(row, 0, filename_item)
-
-            # Status
-            status_item = QTableWidgetItem(download.status.capitalize())
-            if download.status == DownloadStatus.COMPLETED:
-                status_item.setForeground(Qt.GlobalColor.green)
-            elif download.status == DownloadStatus.FAILED:
-                status_item.setForeground(Qt.GlobalColor.red)
-            elif download.status == DownloadStatus.CANCELLED:
-                status_item.setForeground(Qt.GlobalColor.gray)
-            self.table.setItem(row, 1, status_item)
-
-            # Size
-            size_text = format_size(download.total_size) if download.total_size > 0 else "N/A"
-            size_item = QTableWidgetItem(size_text)
-            self.table.setItem(row, 2, size_item)
-
-            # Date
-            date_text = download.created_at.strftime("%Y-%m-%d %H:%M")
-            date_item = QTableWidgetItem(date_text)
-            self.table.setItem(row, 3, date_item)
-
-            # Speed (for completed downloads)
-            if download.status == DownloadStatus.COMPLETED and download.speed > 0:
-                speed_text = f"{download.speed / 1024 / 1024:.1f} MB/s"
-            else:
-                speed_text = "N/A"
-            speed_item = QTableWidgetItem(speed_text)
-            self.table.setItem(row, 4, speed_item)
-
-            # Error message (for failed downloads)
-            error_text = download.error_message[:50] + "..." if len(download.error_message) > 50 else download.error_message
-            error_item = QTableWidgetItem(error_text if download.error_message else "")
-            if download.error_message:
-                error_item.setForeground(Qt.GlobalColor.red)
-            self.table.setItem(row, 5, error_item)
-
-            # Checksum status
-            if download.checksum:
-                checksum_text = f"✓ {download.checksum_algorithm.upper()}"
-                checksum_item = QTableWidgetItem(checksum_text)
-                checksum_item.setForeground(Qt.GlobalColor.green)
-            elif download.expected_checksum:
-                checksum_text = f"✗ Failed"
-                checksum_item = QTableWidgetItem(checksum_text)
-                checksum_item.setForeground(Qt.GlobalColor.red)
-            else:
-                checksum_item = QTableWidgetItem("")
-            self.table.setItem(row, 6, checksum_item)
-
-        # Update status label
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._model.set_rows(self._filtered_downloads)
+            for col in range(1, 7):
+                self.table.resizeColumnToContents(col)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._update_status_label()
+
+    def _update_status_label(self):
+        """Show how many downloads match the filters"""
         count = len(self._filtered_downloads)
         if count == 0:
             self.status_label.setText("No downloads match the current filters")
@@ -196,7 +317,7 @@ class HistoryViewWidget(QWidget):
 
     def _on_search_changed(self):
         """Handle search text change"""
-        self._apply_filters()
+        self._search_timer.start()
 
     def _on_filter_changed(self):
         """Handle status filter change"""
@@ -212,39 +333,41 @@ class HistoryViewWidget(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            # Emit delete signal for all downloads
-            for download in self._downloads:
-                self.delete_requested.emit(download.id)
+            # Emit a single batch delete for all downloads
+            self.delete_many_requested.emit([download.id for download in self._downloads])
 
     def _show_context_menu(self, position):
         """Show right-click context menu"""
-        item = self.table.itemAt(position)
-        if not item:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
 
-        row = item.row()
-        download = self._filtered_downloads[row]
+        download = self._model.download_at(index.row())
+        if download is None:
+            return
 
-        menu = QMenu(self)
+        # Reuse one menu; clearing it also deletes the previous actions
+        menu = self._context_menu
+        menu.clear()
 
         # Open file (only if completed and file exists)
         if download.status == DownloadStatus.COMPLETED:
             open_file_action = menu.addAction("Open File")
-            open_file_action.triggered.connect(lambda: self.open_file_requested.emit(download.id))
+            open_file_action.triggered.connect(partial(self.open_file_requested.emit, download.id))
 
             open_folder_action = menu.addAction("Open Folder")
-            open_folder_action.triggered.connect(lambda: self.open_folder_requested.emit(download.id))
+            open_folder_action.triggered.connect(partial(self.open_folder_requested.emit, download.id))
 
         # Retry failed downloads
         if download.status == DownloadStatus.FAILED:
             retry_action = menu.addAction("Retry Download")
-            retry_action.triggered.connect(lambda: self.retry_requested.emit(download.id))
+            retry_action.triggered.connect(partial(self.retry_requested.emit, download.id))
 
         menu.addSeparator()
 
         # Delete
         delete_action = menu.addAction("Delete from History")
-        delete_action.triggered.connect(lambda: self.delete_requested.emit(download.id))
+        delete_action.triggered.connect(partial(self.delete_requested.emit, download.id))
 
         menu.exec(self.table.mapToGlobal(position))
 
@@ -2,21 +2,27 @@
 Main application window
 """
 
+import logging
 import os
 import sys
 import asyncio
 import json
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set
+
+from yarl import URL
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QScrollArea, QFrame, QToolBar, QStatusBar,
-    QSystemTrayIcon, QMenu, QMessageBox, QApplication, QTabWidget, QDialog
+    QPushButton, QToolBar, QStatusBar,
+    QSystemTrayIcon, QMenu, QMessageBox, QApplication, QTabWidget, QDialog,
+    QStackedLayout, QCheckBox
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QSize
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSlot, QSize, QByteArray
 from PyQt6.QtGui import QIcon, QAction, QCloseEvent
 
 try:
@@ -25,45 +31,155 @@ try:
 except ImportError:
     HAS_QTAWESOME = False
 
-from .styles import DARK_THEME
-from .download_item import DownloadItemWidget
-from .download_dialog import DownloadDialog
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .download_list import DownloadListView
+from .download_dialog import DownloadDialog, DownloadRequest
 from .settings_dialog import SettingsDialog
 from .clipboard_monitor import ClipboardMonitor
 from .batch_dialog import BatchImportDialog
 from .history_view import HistoryViewWidget
+from .video_format_dialog import VideoFormatDialog
 from ..core.downloader import DownloadManager
 from ..core.scheduler import DownloadScheduler
 from ..models.download import Download
 from ..utils.constants import (
     APP_NAME, APP_VERSION, APP_DATA_DIR,
     DEFAULT_DOWNLOAD_DIR, DEFAULT_SEGMENTS, DEFAULT_MAX_CONCURRENT,
-    DownloadStatus
+    DownloadStatus, generate_id
 )
+from ..utils.categories import get_category_from_filename, get_category_save_path
 from ..utils.helpers import format_size, format_speed
+from ..utils.notifications import NotificationManager
+
+logger = logging.getLogger(__name__)
+
+# Progress is shown at a human-readable 1 s cadence; status changes refresh at once
+PROGRESS_REFRESH_MS = 1000
+
+# Settings keys grouped by what has to be re-applied when they change
+_MANAGER_KEYS = frozenset(('max_concurrent', 'default_segments', 'rate_limit'))
+_RETRY_KEYS = frozenset(('enable_retry', 'max_retries', 'retry_delay', 'retry_backoff'))
+_PROXY_KEYS = frozenset((
+    'proxy_enabled', 'proxy_type', 'proxy_host', 'proxy_port', 'proxy_username', 'proxy_password'
+))
+
+# Statuses listed in the History tab
+_HISTORY_STATUSES = frozenset((DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED))
 
+# Batch imports probe at most this many URLs at the same time
+BATCH_ADD_CONCURRENCY = 8
 
+# Playlist video info is looked up this many entries at a time
+PLAYLIST_INFO_CONCURRENCY = 8
+
+
+# Sizes the toolbar, tray and window icons are drawn at
+ICON_SIZES = (16, 20, 24, 32, 48)
+
+
+@lru_cache(maxsize=64)
 def get_icon(icon_name: str, color: str = '#eaeaea'):
-    """Get icon from QtAwesome or return None"""
-    if HAS_QTAWESOME:
-        return qta.icon(icon_name, color=color)
-    return None
+    """Get icon from QtAwesome (cached per name and color) or return None"""
+    if not HAS_QTAWESOME:
+        return None
+    # Rasterize the glyph once per size so repaints reuse pixmaps instead of
+    # re-rendering the icon font
+    source = qta.icon(icon_name, color=color)
+    icon = QIcon()
+    for size in ICON_SIZES:
+        icon.addPixmap(source.pixmap(QSize(size, size)))
+    return icon
+
+
+@lru_cache(maxsize=8)
+def build_proxy_url(proxy_type: str, host: str, port: str, username: str = "", password: str = "") -> Optional[str]:
+    """Build a proxy URL (cached per distinct configuration); None if host or port is missing"""
+    if not (host and port):
+        return None
+    # yarl percent-encodes the credentials and brackets IPv6 hosts
+    try:
+        url = URL.build(
+            scheme=proxy_type,
+            user=username or None,
+            # As before, a password is only sent along with a username
+            password=(password or None) if username else None,
+            host=host,
+            port=int(port)
+        )
+        # yarl only range-checks the port when the URL is rendered
+        return str(url)
+    except ValueError as e:
+        logger.warning("Invalid proxy address %s:%s: %s", host, port, e)
+        return None
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def dump_settings(settings: dict) -> bytes:
+    """Serialize settings as indented JSON without orjson"""
+    if not settings or not all(isinstance(value, _SCALAR_TYPES) for value in settings.values()):
+        return json.dumps(settings, indent=2).encode()
+    # Settings are a flat dict, so write the indented layout directly; each
+    # scalar goes through the C encoder instead of the pure-Python indenting one
+    dumps = json.dumps
+    lines = ",\n".join(f"  {dumps(key)}: {dumps(value)}" for key, value in settings.items())
+    return f"{{\n{lines}\n}}".encode()
+
+
+def proxy_url_from_settings(settings: dict) -> Optional[str]:
+    """Get the proxy URL configured in settings, or None when the proxy is off"""
+    if not settings.get('proxy_enabled', False):
+        return None
+    return build_proxy_url(
+        settings.get('proxy_type', 'http'),
+        settings.get('proxy_host', ''),
+        settings.get('proxy_port', ''),
+        settings.get('proxy_username', ''),
+        settings.get('proxy_password', '')
+    )
+
+
+def _select_opener():
+    """Pick the platform's open-with-default-application function once"""
+    system = platform.system()
+    if system == 'Windows':
+        return os.startfile
+    command = 'open' if system == 'Darwin' else 'xdg-open'  # macOS / Linux and others
+    return lambda path: subprocess.Popen(
+        [command, path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+_OPEN_PATH = _select_opener()
+
+# One worker keeps slow (network) paths from ever blocking the UI thread
+_OPEN_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="open-path")
+
+
+def _open_path_now(path: str):
+    """Run the system opener, logging failures"""
+    try:
+        _OPEN_PATH(path)
+    except Exception as e:
+        logger.warning("Failed to open %s: %s", path, e)
 
 
 def open_path(path: str):
     """
     Open a file or folder using the system's default application.
     Cross-platform implementation supporting Windows, macOS, and Linux.
+    The opener runs on a background worker, so the UI thread never waits on it.
     """
-    try:
-        if platform.system() == 'Windows':
-            os.startfile(path)
-        elif platform.system() == 'Darwin':  # macOS
-            subprocess.run(['open', path], check=True)
-        else:  # Linux and others
-            subprocess.run(['xdg-open', path], check=True)
-    except Exception as e:
-        print(f"Failed to open {path}: {e}")
+    _OPEN_EXECUTOR.submit(_open_path_now, path)
 
 
 class MainWindow(QMainWindow):
@@ -73,25 +189,46 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         # Settings
+        self._saved_settings_data: Optional[bytes] = None  # Last bytes read or written
         self._settings = self._load_settings()
         
         # Download manager
         self._download_manager: Optional[DownloadManager] = None
-        self._download_widgets: Dict[str, DownloadItemWidget] = {}
+        self._dirty_ids: Set[str] = set()  # Downloads with progress since last refresh
+        self._list_state_pending = False  # Count/empty state update queued
+        self._ensured_dirs: Set[str] = set()  # Save directories already created this session
+        self._history_dirty = True  # History must be re-read from the database
+
+        # Running aggregates kept up to date by the download callbacks, so stats and
+        # bulk actions don't rescan every download
+        self._status_of: Dict[str, str] = {}
+        self._ids_by_status: Dict[str, Set[str]] = {}
+        self._active_speeds: Dict[str, float] = {}
+        self._total_speed = 0.0
 
         # Async event loop
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Task] = set()
 
         # Clipboard monitor
         self._clipboard_monitor = None
         self._clipboard_dialog_shown = False
 
+        # Dialogs are built on first use and reused afterwards
+        self._add_dialog: Optional[DownloadDialog] = None
+        self._batch_dialog: Optional[BatchImportDialog] = None
+        self._settings_dialog: Optional[SettingsDialog] = None
+        self._cancel_box: Optional[QMessageBox] = None
+
         # Scheduler
         self._scheduler: Optional[DownloadScheduler] = None
 
         # Notification manager
         self._notification_manager = None
 
+        # Shared video downloader, created on the first video download
+        self._video_downloader = None
+
         # Setup UI
         self._setup_window()
         self._setup_toolbar()
@@ -99,13 +236,23 @@ class MainWindow(QMainWindow):
         self._setup_status_bar()
         self._setup_system_tray()
         
-        # Apply theme
-        self.setStyleSheet(DARK_THEME)
+        # Refresh timer - armed on the first change after a refresh, so an idle
+        # window never wakes up and a burst of progress becomes one UI refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._refresh_dirty)
         
-        # Update timer for progress refresh
-        self._update_timer = QTimer(self)
-        self._update_timer.timeout.connect(self._refresh_downloads)
-        self._update_timer.start(500)  # Update every 500ms
+        # History reload debounce, used while the History tab is shown
+        self._history_timer = QTimer(self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(150)
+        self._history_timer.timeout.connect(self._refresh_history)
+        
+        # Settings save debounce
+        self._save_settings_timer = QTimer(self)
+        self._save_settings_timer.setSingleShot(True)
+        self._save_settings_timer.setInterval(500)
+        self._save_settings_timer.timeout.connect(self._save_settings)
     
     def _setup_window(self):
         """Setup main window properties"""
@@ -115,13 +262,21 @@ class MainWindow(QMainWindow):
         
         # Set window icon
         if HAS_QTAWESOME:
-            self.setWindowIcon(qta.icon('fa5s.download', color='#e94560'))
+            self.setWindowIcon(get_icon('fa5s.download', '#e94560'))
+        
+        screen = QApplication.primaryScreen()
+
+        # Status changes are shown within one display frame, so a burst of them
+        # (e.g. Pause All) collapses into a single refresh
+        self._frame_ms = max(1, round(1000 / (screen.refreshRate() or 60)))
         
-        # Center on screen
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
+        # Restore the last window geometry; only center on the first launch
+        geometry = self._settings.get('geometry')
+        if not geometry or not self.restoreGeometry(QByteArray.fromBase64(geometry.encode())):
+            screen_rect = screen.geometry()
+            x = (screen_rect.width() - self.width()) // 2
+            y = (screen_rect.height() - self.height()) // 2
+            self.move(x, y)
     
     def _setup_toolbar(self):
         """Setup the toolbar"""
@@ -130,44 +285,21 @@ class MainWindow(QMainWindow):
         toolbar.setIconSize(QSize(20, 20))
         self.addToolBar(toolbar)
         
-        # Add download button
-        self.add_btn = QPushButton(" Add Download")
-        if HAS_QTAWESOME:
-            self.add_btn.setIcon(qta.icon('fa5s.plus', color='#eaeaea'))
-        self.add_btn.clicked.connect(self._on_add_download)
-        toolbar.addWidget(self.add_btn)
-
-        # Batch import button
-        self.batch_btn = QPushButton(" Batch Import")
-        if HAS_QTAWESOME:
-            self.batch_btn.setIcon(qta.icon('fa5s.list', color='#eaeaea'))
-        self.batch_btn.clicked.connect(self._on_batch_import)
-        toolbar.addWidget(self.batch_btn)
-
-        toolbar.addSeparator()
-        
-        # Resume all button
-        self.resume_all_btn = QPushButton(" Resume All")
-        if HAS_QTAWESOME:
-            self.resume_all_btn.setIcon(qta.icon('fa5s.play', color='#eaeaea'))
-        self.resume_all_btn.clicked.connect(self._on_resume_all)
-        toolbar.addWidget(self.resume_all_btn)
-        
-        # Pause all button
-        self.pause_all_btn = QPushButton(" Pause All")
-        if HAS_QTAWESOME:
-            self.pause_all_btn.setIcon(qta.icon('fa5s.pause', color='#eaeaea'))
-        self.pause_all_btn.clicked.connect(self._on_pause_all)
-        toolbar.addWidget(self.pause_all_btn)
-        
-        toolbar.addSeparator()
-        
-        # Clear completed button
-        self.clear_btn = QPushButton(" Clear Completed")
-        if HAS_QTAWESOME:
-            self.clear_btn.setIcon(qta.icon('fa5s.trash-alt', color='#eaeaea'))
-        self.clear_btn.clicked.connect(self._on_clear_completed)
-        toolbar.addWidget(self.clear_btn)
+        # (attribute, text, icon, slot); None adds a separator
+        buttons = (
+            ('add_btn', " Add Download", 'fa5s.plus', self._on_add_download),
+            ('batch_btn', " Batch Import", 'fa5s.list', self._on_batch_import),
+            None,
+            ('resume_all_btn', " Resume All", 'fa5s.play', self._on_resume_all),
+            ('pause_all_btn', " Pause All", 'fa5s.pause', self._on_pause_all),
+            None,
+            ('clear_btn', " Clear Completed", 'fa5s.trash-alt', self._on_clear_completed),
+        )
+        for entry in buttons:
+            if entry is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addWidget(self._make_toolbar_button(*entry))
         
         # Spacer
         spacer = QWidget()
@@ -175,11 +307,16 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(spacer)
         
         # Settings button
-        self.settings_btn = QPushButton(" Settings")
+        toolbar.addWidget(self._make_toolbar_button('settings_btn', " Settings", 'fa5s.cog', self._on_settings))
+    
+    def _make_toolbar_button(self, attr: str, text: str, icon_name: str, slot) -> QPushButton:
+        """Create a toolbar button and store it as self.<attr>"""
+        button = QPushButton(text)
         if HAS_QTAWESOME:
-            self.settings_btn.setIcon(qta.icon('fa5s.cog', color='#eaeaea'))
-        self.settings_btn.clicked.connect(self._on_settings)
-        toolbar.addWidget(self.settings_btn)
+            button.setIcon(get_icon(icon_name))
+        button.clicked.connect(slot)
+        setattr(self, attr, button)
+        return button
     
     def _setup_central_widget(self):
         """Setup the central widget with tabs"""
@@ -211,27 +348,26 @@ class MainWindow(QMainWindow):
         header_layout.addWidget(self.download_count_label)
         downloads_layout.addLayout(header_layout)
 
-        # Scroll area for downloads
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-
-        self.downloads_container = QWidget()
-        self.downloads_layout = QVBoxLayout(self.downloads_container)
-        self.downloads_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.downloads_layout.setSpacing(10)
-        self.downloads_layout.setContentsMargins(0, 0, 0, 0)
-
-        scroll.setWidget(self.downloads_container)
-        downloads_layout.addWidget(scroll)
-
         # Empty state
         self.empty_label = QLabel("No downloads yet. Click '+ Add Download' to start.")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.empty_label.setObjectName("subtitleLabel")
         self.empty_label.setStyleSheet("padding: 50px; color: #666;")
-        self.downloads_layout.addWidget(self.empty_label)
+
+        # Virtualized list - only visible rows get a DownloadItemWidget
+        self.download_list = DownloadListView()
+        self.download_list.pause_clicked.connect(self._on_pause_download)
+        self.download_list.resume_clicked.connect(self._on_resume_download)
+        self.download_list.cancel_clicked.connect(self._on_cancel_download)
+        self.download_list.open_file_clicked.connect(self._on_open_file)
+        self.download_list.open_folder_clicked.connect(self._on_open_folder)
+
+        # Empty state and list share one area; only the current page is shown
+        stack_container = QWidget()
+        self._downloads_stack = QStackedLayout(stack_container)
+        self._downloads_stack.addWidget(self.empty_label)   # Page 0: empty
+        self._downloads_stack.addWidget(self.download_list)  # Page 1: list
+        downloads_layout.addWidget(stack_container, 1)
 
         # Add downloads tab
         self.tab_widget.addTab(downloads_tab, "Downloads")
@@ -241,6 +377,7 @@ class MainWindow(QMainWindow):
         self.history_view.open_file_requested.connect(self._on_open_file)
         self.history_view.open_folder_requested.connect(self._on_open_folder)
         self.history_view.delete_requested.connect(self._on_history_delete)
+        self.history_view.delete_many_requested.connect(self._on_history_delete_many)
         self.history_view.retry_requested.connect(self._on_history_retry)
         self.tab_widget.addTab(self.history_view, "History")
 
@@ -264,7 +401,7 @@ class MainWindow(QMainWindow):
         
         # Set tray icon
         if HAS_QTAWESOME:
-            self.tray_icon.setIcon(qta.icon('fa5s.download', color='#e94560'))
+            self.tray_icon.setIcon(get_icon('fa5s.download', '#e94560'))
         else:
             # Use default Qt icon as fallback
             self.tray_icon.setIcon(self.style().standardIcon(
@@ -289,6 +426,14 @@ class MainWindow(QMainWindow):
         self.tray_icon.activated.connect(self._on_tray_activated)
         self.tray_icon.show()
     
+    def _run_async(self, coro) -> asyncio.Task:
+        """Schedule a coroutine on the asyncio loop (it is pumped on this thread)"""
+        task = self._loop.create_task(coro)
+        # Keep a reference until it finishes so the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
     async def initialize(self):
         """Initialize async components"""
         self._loop = asyncio.get_event_loop()
@@ -296,20 +441,7 @@ class MainWindow(QMainWindow):
         # Initialize download manager
         rate_limit = self._settings.get('rate_limit', 0)
 
-        # Build proxy URL if enabled
-        proxy_url = None
-        if self._settings.get('proxy_enabled', False):
-            proxy_type = self._settings.get('proxy_type', 'http')
-            proxy_host = self._settings.get('proxy_host', '')
-            proxy_port = self._settings.get('proxy_port', '')
-            proxy_username = self._settings.get('proxy_username', '')
-            proxy_password = self._settings.get('proxy_password', '')
-
-            if proxy_host and proxy_port:
-                if proxy_username:
-                    proxy_url = f"{proxy_type}://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-                else:
-                    proxy_url = f"{proxy_type}://{proxy_host}:{proxy_port}"
+        proxy_url = proxy_url_from_settings(self._settings)
 
         self._download_manager = DownloadManager(
             max_concurrent=self._settings.get('max_concurrent', DEFAULT_MAX_CONCURRENT),
@@ -330,7 +462,6 @@ class MainWindow(QMainWindow):
         await self._scheduler.start()
 
         # Initialize notification manager
-        from ..utils.notifications import NotificationManager
         self._notification_manager = NotificationManager()
 
         # Initialize clipboard monitor
@@ -342,7 +473,6 @@ class MainWindow(QMainWindow):
         for download in self._download_manager.get_all_downloads():
             self._add_download_widget(download)
 
-        self._update_empty_state()
         self._update_stats()
     
     async def shutdown(self):
@@ -354,26 +484,45 @@ class MainWindow(QMainWindow):
     
     def _on_add_download(self):
         """Handle add download button click"""
-        dialog = DownloadDialog(self)
-        dialog.download_requested.connect(self._start_new_download)
-        dialog.video_download_requested.connect(self._on_video_download_requested)
-        dialog.exec()
+        self._show_add_dialog()
+
+    def _show_add_dialog(self, url: str = ""):
+        """Show the (cached) add download dialog, optionally pre-filled with a URL"""
+        if self._add_dialog is None:
+            self._add_dialog = DownloadDialog(self)
+            self._add_dialog.download_requested.connect(self._on_download_requested)
+            self._add_dialog.video_download_requested.connect(self._on_video_download_requested)
+        self._add_dialog.reset(url)
+        self._add_dialog.exec()
 
     def _on_batch_import(self):
         """Handle batch import button click"""
-        dialog = BatchImportDialog(self)
-        dialog.downloads_requested.connect(self._start_batch_downloads)
-        dialog.exec()
+        if self._batch_dialog is None:
+            self._batch_dialog = BatchImportDialog(self)
+            self._batch_dialog.downloads_requested.connect(self._start_batch_downloads)
+        self._batch_dialog.reset()
+        self._batch_dialog.exec()
 
     def _start_batch_downloads(self, downloads: list):
         """Start multiple downloads from batch import"""
-        for url, save_dir, num_segments, category in downloads:
-            QTimer.singleShot(0, lambda u=url, d=save_dir, s=num_segments, c=category:
-                self._start_new_download(u, d, s, c))
+        if self._loop and self._download_manager:
+            self._run_async(self._batch_add(downloads))
+
+    async def _batch_add(self, downloads: list):
+        """Add and start a batch of downloads concurrently"""
+        # Each add probes the server for file info; bound how many probes are in
+        # flight. Running downloads are bounded by DownloadManager.start_download.
+        semaphore = asyncio.Semaphore(BATCH_ADD_CONCURRENCY)
+
+        async def add(url: str, save_dir: str, num_segments: int, category: str):
+            async with semaphore:
+                await self._add_and_start_download(url, save_dir, num_segments, category)
+
+        await asyncio.gather(*(add(*download) for download in downloads))
 
     def _start_scheduled_download(self, url: str, save_dir: str, num_segments: int, category: str = "all"):
         """Callback for starting a scheduled download"""
-        QTimer.singleShot(0, lambda: self._start_new_download(url, save_dir, num_segments, category))
+        self._start_new_download(url, save_dir, num_segments, category)
 
     def _on_url_detected(self, url: str):
         """Handle URL detected in clipboard"""
@@ -392,13 +541,22 @@ class MainWindow(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             # Show download dialog with the URL
-            dialog = DownloadDialog(self, url=url)
-            dialog.download_requested.connect(self._start_new_download)
-            dialog.video_download_requested.connect(self._on_video_download_requested)
-            dialog.exec()
+            self._show_add_dialog(url)
 
         self._clipboard_dialog_shown = False
 
+    def _on_download_requested(self, request: DownloadRequest):
+        """Handle a download confirmed in the download dialog"""
+        self._start_new_download(
+            request.url,
+            request.save_dir,
+            request.num_segments,
+            request.category,
+            request.scheduled_time,
+            request.expected_checksum,
+            request.checksum_algorithm
+        )
+
     def _start_new_download(self, url: str, save_dir: str, num_segments: int, category: str = "all", scheduled_time=None, expected_checksum: str = "", checksum_algorithm: str = ""):
         """Start a new download"""
         if scheduled_time and self._scheduler:
@@ -410,15 +568,10 @@ class MainWindow(QMainWindow):
                 f"Download has been scheduled for:\n{scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}"
             )
         elif self._loop and self._download_manager:
-            asyncio.run_coroutine_threadsafe(
-                self._add_and_start_download(url, save_dir, num_segments, category, expected_checksum, checksum_algorithm),
-                self._loop
-            )
+            self._run_async(self._add_and_start_download(url, save_dir, num_segments, category, expected_checksum, checksum_algorithm))
 
     def _on_video_download_requested(self, url: str, save_dir: str, category: str):
         """Handle video download request - show format selection dialog"""
-        from .video_format_dialog import VideoFormatDialog
-
         # Show format selection dialog
         dialog = VideoFormatDialog(url, self)
         dialog.format_selected.connect(lambda format_ids, video_info: self._start_video_download(url, save_dir, format_ids, category))
@@ -432,26 +585,27 @@ class MainWindow(QMainWindow):
         """Start video downloads with selected format(s)"""
         if self._loop and self._download_manager:
             for format_id in format_ids:
-                asyncio.run_coroutine_threadsafe(
-                    self._add_and_start_video_download(url, save_dir, format_id, category),
-                    self._loop
-                )
+                self._run_async(self._add_and_start_video_download(url, save_dir, format_id, category))
 
-    async def _add_and_start_video_download(self, url: str, save_dir: str, format_id: str, category: str):
-        """Add and start a video download (async)"""
-        try:
+    def _get_video_downloader(self):
+        """Get the shared VideoDownloader, creating it on first use"""
+        if self._video_downloader is None:
+            # Imported once, on first use: yt-dlp is heavy and only needed for videos
             from ..core.video_downloader import VideoDownloader
-            from ..models.download import DownloadStatus
-            import os
+            self._video_downloader = VideoDownloader()
+        return self._video_downloader
 
+    async def _add_and_start_video_download(self, url: str, save_dir: str, format_id: str, category: str, info: Optional[dict] = None):
+        """Add and start a video download (async); info skips the lookup when already fetched"""
+        try:
             # Ensure save directory exists
-            os.makedirs(save_dir, exist_ok=True)
+            await self._ensure_dir(save_dir)
 
-            # Create video downloader
-            video_downloader = VideoDownloader()
+            video_downloader = self._get_video_downloader()
 
             # Get video info first
-            info = await video_downloader.get_video_info(url)
+            if info is None:
+                info = await video_downloader.get_video_info(url)
 
             # Check if it's a playlist
             if info.get('is_playlist'):
@@ -469,10 +623,6 @@ class MainWindow(QMainWindow):
 
             filename = f"{info['title']}.{extension}"
 
-            # Import Download model
-            from ..models.download import Download
-            from ..utils.constants import generate_id
-
             download_id = generate_id()
 
             download = Download(
@@ -494,8 +644,8 @@ class MainWindow(QMainWindow):
             # Add to download manager tracking
             self._download_manager.downloads[download_id] = download
 
-            # Add widget on main thread AFTER setting status to DOWNLOADING
-            QTimer.singleShot(0, lambda: self._add_download_widget(download))
+            # Add widget AFTER setting status to DOWNLOADING (the loop runs on the GUI thread)
+            self._add_download_widget(download)
 
             # Start the download
             await self._download_video_with_progress(download, video_downloader)
@@ -511,20 +661,28 @@ class MainWindow(QMainWindow):
     async def _download_video_with_progress(self, download, video_downloader):
         """Download video with progress tracking"""
         try:
-            from ..models.download import DownloadStatus
-            import os
-
             save_dir = os.path.dirname(download.save_path)
+            loop = asyncio.get_running_loop()
+            notify_pending = False
+
+            def notify_progress():
+                """Runs on the GUI thread: queue the row for the next refresh"""
+                nonlocal notify_pending
+                notify_pending = False
+                self._on_download_progress(download)
 
             def progress_callback(progress, downloaded, total, speed):
-                """Progress callback from video downloader"""
+                """Progress callback from video downloader (called on a yt-dlp worker thread)"""
+                nonlocal notify_pending
                 # Update download progress - progress is calculated from downloaded_size / total_size
                 download.downloaded_size = downloaded
                 download.total_size = total
                 download.speed = speed
 
-                # Notify progress
-                self._download_manager._notify_progress(download)
+                # Hand off to the GUI thread, with at most one notification in flight
+                if not notify_pending:
+                    notify_pending = True
+                    loop.call_soon_threadsafe(notify_progress)
 
             # Start download
             result = await video_downloader.download_video(
@@ -547,13 +705,11 @@ class MainWindow(QMainWindow):
                 # Notify status change
                 self._download_manager._notify_status(download)
             else:
-                from ..models.download import DownloadStatus
                 download.status = DownloadStatus.FAILED
                 download.error_message = result.get('error', 'Unknown error')
                 self._download_manager._notify_status(download)
 
         except Exception as e:
-            from ..models.download import DownloadStatus
             download.status = DownloadStatus.FAILED
             download.error_message = str(e)
             self._download_manager._notify_status(download)
@@ -561,9 +717,7 @@ class MainWindow(QMainWindow):
     async def _handle_playlist_download(self, url: str, save_dir: str, format_id: str, category: str, info: dict):
         """Handle playlist download - add all videos to queue"""
         try:
-            from ..core.video_downloader import VideoDownloader
-
-            video_downloader = VideoDownloader()
+            video_downloader = self._get_video_downloader()
 
             # Get playlist videos
             playlist_videos = await video_downloader.get_playlist_videos(url)
@@ -579,28 +733,40 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-            # Add each video to download queue
-            for i, video in enumerate(playlist_videos):
+            # Video downloads bypass the download manager's queue, so bound how
+            # many of them run at once with the same concurrency limit
+            semaphore = asyncio.Semaphore(
+                max(1, self._settings.get('max_concurrent', DEFAULT_MAX_CONCURRENT))
+            )
+            # Info lookups are short, so they run ahead of the downloads with their own limit
+            info_semaphore = asyncio.Semaphore(PLAYLIST_INFO_CONCURRENCY)
+
+            async def add_video(i: int, video: dict):
                 try:
-                    # Recursively call _add_and_start_video_download for each video
-                    await self._add_and_start_video_download(
-                        url=video['url'],
-                        save_dir=save_dir,
-                        format_id=format_id,
-                        category=category
-                    )
+                    async with info_semaphore:
+                        video_info = await video_downloader.get_video_info(video['url'])
+                    async with semaphore:
+                        await self._add_and_start_video_download(
+                            url=video['url'],
+                            save_dir=save_dir,
+                            format_id=format_id,
+                            category=category,
+                            info=video_info
+                        )
+                except Exception as e:
+                    logger.warning("Error adding video %d from playlist: %s", i + 1, e)
 
-                    # Small delay between adding to avoid overwhelming
-                    await asyncio.sleep(0.5)
+            async def add_all():
+                await asyncio.gather(*(add_video(i, video) for i, video in enumerate(playlist_videos)))
 
-                except Exception as e:
-                    print(f"Error adding video {i+1} from playlist from playlist: {e}")
+            # Queue every video as one task instead of one after another
+            self._run_async(add_all())
 
-            QMessageBox.information(
+            QTimer.singleShot(0, lambda count=len(playlist_videos): QMessageBox.information(
                 self,
                 "Playlist Queued",
-                f"Added {len(playlist_videos)} videos to the download queue."
-            )
+                f"Added {count} videos to the download queue."
+            ))
 
         except Exception as e:
             error_msg = str(e)
@@ -613,11 +779,8 @@ class MainWindow(QMainWindow):
     async def _add_and_start_download(self, url: str, save_dir: str, num_segments: int, category: str = "all", expected_checksum: str = "", checksum_algorithm: str = ""):
         """Add and start a download (async)"""
         try:
-            import os
-            from ..utils.categories import get_category_from_filename, get_category_save_path
-
             # Ensure save directory exists
-            os.makedirs(save_dir, exist_ok=True)
+            await self._ensure_dir(save_dir)
 
             download = await self._download_manager.add_download(
                 url=url,
@@ -638,71 +801,131 @@ class MainWindow(QMainWindow):
                 if detected_category != "all":
                     new_save_dir = get_category_save_path(save_dir, detected_category)
                     if new_save_dir != save_dir:
-                        os.makedirs(new_save_dir, exist_ok=True)
+                        await self._ensure_dir(new_save_dir)
                         download.save_path = os.path.join(new_save_dir, download.filename)
 
-            # Add widget on main thread
-            QTimer.singleShot(0, lambda: self._add_download_widget(download))
+            # The loop runs on the GUI thread, so the widget can be added directly
+            self._add_download_widget(download)
 
             # Start if auto-start is enabled
             if self._settings.get('auto_start', True):
                 await self._download_manager.start_download(download.id)
         except Exception as e:
             error_msg = str(e)
+            # Modal dialogs must not run inside the loop pump, so defer them to Qt
             QTimer.singleShot(0, lambda msg=error_msg: QMessageBox.critical(
                 self, "Error", f"Failed to add download: {msg}"
             ))
     
+    async def _ensure_dir(self, path: str):
+        """Create a save directory once per session, off the event loop thread"""
+        if path not in self._ensured_dirs:
+            # mkdir can block on slow or network drives, so run it in the executor
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(os.makedirs, path, exist_ok=True)
+            )
+            self._ensured_dirs.add(path)
+    
+    async def _retry_download(self, download: Download):
+        """Persist a reset download through the background writer, then start it"""
+        self._download_manager.db_writer.save_download(download)
+        await self._download_manager.start_download(download.id)
+
     def _add_download_widget(self, download: Download):
-        """Add a download widget to the list"""
-        # Hide empty label
-        self.empty_label.hide()
-        
-        # Create widget
-        widget = DownloadItemWidget(download)
-        widget.pause_clicked.connect(self._on_pause_download)
-        widget.resume_clicked.connect(self._on_resume_download)
-        widget.cancel_clicked.connect(self._on_cancel_download)
-        widget.open_file_clicked.connect(self._on_open_file)
-        widget.open_folder_clicked.connect(self._on_open_folder)
-        
-        # Add to layout
-        self.downloads_layout.insertWidget(0, widget)
-        self._download_widgets[download.id] = widget
-        
-        # Update count
-        self._update_download_count()
+        """Add a download to the list"""
+        self.download_list.add_download(download)
+        self._track(download)
+        self._schedule_list_state()
     
     def _remove_download_widget(self, download_id: str):
-        """Remove a download widget from the list"""
-        if download_id in self._download_widgets:
-            widget = self._download_widgets[download_id]
-            self.downloads_layout.removeWidget(widget)
-            widget.deleteLater()
-            del self._download_widgets[download_id]
-            
-            self._update_empty_state()
-            self._update_download_count()
+        """Remove a download from the list"""
+        self._untrack(download_id)
+        if self.download_list.contains(download_id):
+            self.download_list.remove_download(download_id)
+            self._schedule_list_state()
+    
+    def _schedule_list_state(self):
+        """Update the count and empty state once for a burst of adds/removes"""
+        if not self._list_state_pending:
+            self._list_state_pending = True
+            QTimer.singleShot(0, self._update_list_state)
+    
+    def _update_list_state(self):
+        """Refresh the download count label and empty state"""
+        self._list_state_pending = False
+        self._update_empty_state()
+        self._update_download_count()
     
     def _update_empty_state(self):
-        """Update empty state visibility"""
-        if not self._download_widgets:
-            self.empty_label.show()
-        else:
-            self.empty_label.hide()
+        """Switch between the empty state and the list when the count crosses zero"""
+        page = 1 if self.download_list.count() else 0
+        if self._downloads_stack.currentIndex() != page:
+            self._downloads_stack.setCurrentIndex(page)
     
     def _update_download_count(self):
         """Update download count label"""
-        count = len(self._download_widgets)
+        count = self.download_list.count()
         self.download_count_label.setText(f"{count} download{'s' if count != 1 else ''}")
     
+    def _track(self, download: Download):
+        """Update the status index and speed total for a download"""
+        download_id = download.id
+        status = download.status
+        previous = self._status_of.get(download_id)
+        if status != previous:
+            if previous is not None:
+                self._ids_by_status[previous].discard(download_id)
+            self._ids_by_status.setdefault(status, set()).add(download_id)
+            self._status_of[download_id] = status
+        
+        speed = download.speed if status == DownloadStatus.DOWNLOADING else 0.0
+        old_speed = self._active_speeds.pop(download_id, 0.0)
+        if speed:
+            self._active_speeds[download_id] = speed
+        if self._active_speeds:
+            self._total_speed += speed - old_speed
+        else:
+            self._total_speed = 0.0  # Reset so float drift can't accumulate
+    
+    def _untrack(self, download_id: str):
+        """Forget a removed download in the aggregates"""
+        status = self._status_of.pop(download_id, None)
+        if status is not None:
+            self._ids_by_status[status].discard(download_id)
+        self._total_speed -= self._active_speeds.pop(download_id, 0.0)
+        if not self._active_speeds:
+            self._total_speed = 0.0
+    
+    def _ids_with_status(self, *statuses: str) -> List[str]:
+        """Ids of downloads currently in any of the given statuses"""
+        return [
+            download_id
+            for status in statuses
+            for download_id in self._ids_by_status.get(status, ())
+        ]
+    
+    def _mark_dirty(self, download_id: str, delay: int = PROGRESS_REFRESH_MS):
+        """Queue a download for a coalesced UI refresh within delay ms"""
+        self._dirty_ids.add(download_id)
+        timer = self._refresh_timer
+        if not timer.isActive() or timer.remainingTime() > delay:
+            timer.start(delay)
+    
     def _on_download_progress(self, download: Download):
         """Callback for download progress updates"""
-        # Update is handled by the timer for batching
-        pass
+        # Progress still queued for a removed (e.g. cancelled) download must not
+        # bring it back; only adds and status changes create entries
+        if download.id not in self._status_of:
+            return
+        self._track(download)
+        # Only mark as dirty - the refresh timer batches the actual UI update
+        self._mark_dirty(download.id)
     
     def _on_download_status_changed(self, download: Download):
         """Callback for download status changes"""
+        previous = self._status_of.get(download.id)
+        self._track(download)
+        
         # Show notification if enabled and download completed or failed
         if self._notification_manager and self._settings.get('notify_complete', True):
             if download.status == DownloadStatus.COMPLETED:
@@ -717,22 +940,28 @@ class MainWindow(QMainWindow):
                     download.error_message or "Unknown error"
                 )
 
-        QTimer.singleShot(0, lambda: self._update_download_widget(download))
-    
-    def _update_download_widget(self, download: Download):
-        """Update a download widget"""
-        if download.id in self._download_widgets:
-            self._download_widgets[download.id].update_download(download)
-        self._update_stats()
+        self._mark_dirty(download.id, self._frame_ms)
+        # Only moves into or out of a finished state change what the history shows
+        if previous != download.status and (
+                previous in _HISTORY_STATUSES or download.status in _HISTORY_STATUSES):
+            self._mark_history_dirty()
     
-    def _refresh_downloads(self):
-        """Refresh all download displays"""
-        if not self._download_manager:
+    def _refresh_dirty(self):
+        """Refresh displays of downloads that changed since the last refresh"""
+        if not self._download_manager or not self._dirty_ids:
             return
         
-        for download in self._download_manager.get_all_downloads():
-            if download.id in self._download_widgets:
-                self._download_widgets[download.id].update_download(download)
+        # Nothing to paint while hidden or minimized; showing the window flushes
+        if not self.isVisible() or self.isMinimized():
+            return
+        
+        # Rows are only visible on the Downloads tab; keep them dirty until it is shown
+        if self.tab_widget.currentIndex() == 0:
+            for download_id in self._dirty_ids:
+                download = self._download_manager.get_download(download_id)
+                if download:
+                    self.download_list.update_download(download)
+            self._dirty_ids.clear()
         
         self._update_stats()
     
@@ -741,9 +970,8 @@ class MainWindow(QMainWindow):
         if not self._download_manager:
             return
         
-        downloads = self._download_manager.get_all_downloads()
-        active = sum(1 for d in downloads if d.is_active)
-        total_speed = sum(d.speed for d in downloads if d.is_active)
+        active = len(self._ids_by_status.get(DownloadStatus.DOWNLOADING, ()))
+        total_speed = self._total_speed
         
         if active > 0:
             self.stats_label.setText(
@@ -756,35 +984,41 @@ class MainWindow(QMainWindow):
     def _on_pause_download(self, download_id: str):
         """Handle pause download"""
         if self._loop and self._download_manager:
-            asyncio.run_coroutine_threadsafe(
-                self._download_manager.pause_download(download_id),
-                self._loop
-            )
+            self._run_async(self._download_manager.pause_download(download_id))
     
     @pyqtSlot(str)
     def _on_resume_download(self, download_id: str):
         """Handle resume download"""
         if self._loop and self._download_manager:
-            asyncio.run_coroutine_threadsafe(
-                self._download_manager.start_download(download_id),
-                self._loop
-            )
+            self._run_async(self._download_manager.start_download(download_id))
     
+    def _confirm_cancel(self) -> bool:
+        """Ask before cancelling, reusing one message box"""
+        if not self._settings.get('confirm_cancel', True):
+            return True
+        if self._cancel_box is None:
+            self._cancel_box = QMessageBox(
+                QMessageBox.Icon.Question, "Cancel Download",
+                "Are you sure you want to cancel this download?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
+            )
+            self._cancel_box.setCheckBox(QCheckBox("Don't ask again"))
+        self._cancel_box.checkBox().setChecked(False)
+
+        if self._cancel_box.exec() != QMessageBox.StandardButton.Yes:
+            return False
+        if self._cancel_box.checkBox().isChecked():
+            # Can be turned back on in Settings
+            self._settings['confirm_cancel'] = False
+            self._schedule_save_settings()
+        return True
+
     @pyqtSlot(str)
     def _on_cancel_download(self, download_id: str):
         """Handle cancel download"""
-        reply = QMessageBox.question(
-            self, "Cancel Download",
-            "Are you sure you want to cancel this download?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm_cancel():
             if self._loop and self._download_manager:
-                asyncio.run_coroutine_threadsafe(
-                    self._download_manager.cancel_download(download_id),
-                    self._loop
-                )
+                self._run_async(self._download_manager.cancel_download(download_id))
             self._remove_download_widget(download_id)
     
     @pyqtSlot(str)
@@ -792,7 +1026,8 @@ class MainWindow(QMainWindow):
         """Handle open file"""
         if self._download_manager:
             download = self._download_manager.get_download(download_id)
-            if download and os.path.exists(download.save_path):
+            # Trust the model instead of stat-ing a possibly slow (network) path
+            if download and download.is_complete:
                 open_path(download.save_path)
 
     @pyqtSlot(str)
@@ -801,89 +1036,86 @@ class MainWindow(QMainWindow):
         if self._download_manager:
             download = self._download_manager.get_download(download_id)
             if download:
-                folder = os.path.dirname(download.save_path)
-                if os.path.exists(folder):
-                    open_path(folder)
+                # A missing folder is reported by the system opener
+                open_path(os.path.dirname(download.save_path))
     
     def _on_resume_all(self):
         """Resume all paused downloads"""
         if self._loop and self._download_manager:
-            for download in self._download_manager.get_all_downloads():
-                if download.status in (DownloadStatus.PAUSED, DownloadStatus.QUEUED):
-                    asyncio.run_coroutine_threadsafe(
-                        self._download_manager.start_download(download.id),
-                        self._loop
-                    )
+            download_ids = self._ids_with_status(DownloadStatus.PAUSED, DownloadStatus.QUEUED)
+            if download_ids:
+                self._run_async(self._gather_all(self._download_manager.start_download, download_ids))
     
     def _on_pause_all(self):
         """Pause all active downloads"""
         if self._loop and self._download_manager:
-            for download in self._download_manager.get_all_downloads():
-                if download.is_active:
-                    asyncio.run_coroutine_threadsafe(
-                        self._download_manager.pause_download(download.id),
-                        self._loop
-                    )
+            download_ids = self._ids_with_status(DownloadStatus.DOWNLOADING)
+            if download_ids:
+                self._run_async(self._gather_all(self._download_manager.pause_download, download_ids))
+
+    async def _gather_all(self, action, download_ids: List[str]):
+        """Run a download manager action for many downloads as one task"""
+        # gather rather than a TaskGroup: one download failing must not cancel the rest
+        await asyncio.gather(*(action(download_id) for download_id in download_ids))
     
     def _on_clear_completed(self):
         """Clear completed downloads"""
         if self._download_manager:
-            completed_ids = [
-                d.id for d in self._download_manager.get_all_downloads()
-                if d.is_complete
-            ]
+            completed_ids = self._ids_with_status(DownloadStatus.COMPLETED)
             
+            # Remove all rows and database entries in one pass each
+            self.download_list.remove_downloads(completed_ids)
+            self._download_manager.db_writer.delete_downloads(completed_ids)
             for download_id in completed_ids:
-                self._remove_download_widget(download_id)
-                self._download_manager.db.delete_download(download_id)
-                if download_id in self._download_manager.downloads:
-                    del self._download_manager.downloads[download_id]
+                self._download_manager.downloads.pop(download_id, None)
+                self._untrack(download_id)
+            
+            self._schedule_list_state()
+            self._mark_history_dirty()
     
     def _on_settings(self):
         """Open settings dialog"""
-        dialog = SettingsDialog(self._settings, self)
-        dialog.settings_changed.connect(self._apply_settings)
-        dialog.exec()
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self._settings, self)
+            self._settings_dialog.settings_changed.connect(self._apply_settings)
+        else:
+            self._settings_dialog.reset(self._settings)
+        self._settings_dialog.exec()
     
     def _apply_settings(self, settings: dict):
         """Apply new settings"""
-        self._settings = settings
-        self._save_settings()
+        changed = {key for key, value in settings.items() if self._settings.get(key) != value}
+        if not changed:
+            return
+        # Merge so keys the dialog doesn't edit (e.g. window geometry) survive
+        self._settings.update(settings)
+        self._schedule_save_settings()
 
         # Apply to download manager
         if self._download_manager:
-            self._download_manager.max_concurrent = settings.get('max_concurrent', DEFAULT_MAX_CONCURRENT)
-            self._download_manager.default_segments = settings.get('default_segments', DEFAULT_SEGMENTS)
-            rate_limit = settings.get('rate_limit', 0)
-            self._download_manager.rate_limit = rate_limit if rate_limit > 0 else None
+            if changed & _MANAGER_KEYS:
+                self._download_manager.max_concurrent = settings.get('max_concurrent', DEFAULT_MAX_CONCURRENT)
+                self._download_manager.default_segments = settings.get('default_segments', DEFAULT_SEGMENTS)
+                rate_limit = settings.get('rate_limit', 0)
+                self._download_manager.rate_limit = rate_limit if rate_limit > 0 else None
 
             # Apply retry settings
-            self._download_manager.enable_retry = settings.get('enable_retry', True)
-            self._download_manager.max_retries = settings.get('max_retries', 3)
-            self._download_manager.retry_delay = settings.get('retry_delay', 5.0)
-            self._download_manager.retry_backoff = settings.get('retry_backoff', 2.0)
+            if changed & _RETRY_KEYS:
+                self._download_manager.enable_retry = settings.get('enable_retry', True)
+                self._download_manager.max_retries = settings.get('max_retries', 3)
+                self._download_manager.retry_delay = settings.get('retry_delay', 5.0)
+                self._download_manager.retry_backoff = settings.get('retry_backoff', 2.0)
 
             # Apply proxy settings - requires rebuilding session
-            proxy_url = None
-            if settings.get('proxy_enabled', False):
-                proxy_type = settings.get('proxy_type', 'http')
-                proxy_host = settings.get('proxy_host', '')
-                proxy_port = settings.get('proxy_port', '')
-                proxy_username = settings.get('proxy_username', '')
-                proxy_password = settings.get('proxy_password', '')
-
-                if proxy_host and proxy_port:
-                    if proxy_username:
-                        proxy_url = f"{proxy_type}://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-                    else:
-                        proxy_url = f"{proxy_type}://{proxy_host}:{proxy_port}"
-
-            self._download_manager.proxy_url = proxy_url
-            # Note: Proxy changes require restarting the download manager for active downloads
-            # This is a limitation of aiohttp's session architecture
+            if changed & _PROXY_KEYS:
+                proxy_url = proxy_url_from_settings(settings)
+                if proxy_url != self._download_manager.proxy_url:
+                    self._download_manager.proxy_url = proxy_url
+                # Note: Proxy changes require restarting the download manager for active downloads
+                # This is a limitation of aiohttp's session architecture
 
         # Apply to clipboard monitor
-        if self._clipboard_monitor:
+        if self._clipboard_monitor and 'watch_clipboard' in changed:
             self._clipboard_monitor.set_enabled(settings.get('watch_clipboard', False))
     
     def _load_settings(self) -> dict:
@@ -891,20 +1123,37 @@ class MainWindow(QMainWindow):
         settings_path = APP_DATA_DIR / "settings.json"
         if settings_path.exists():
             try:
-                with open(settings_path) as f:
-                    return json.load(f)
+                data = settings_path.read_bytes()
+                settings = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+                self._saved_settings_data = data
+                return settings
             except:
                 pass
         return {}
     
+    def _schedule_save_settings(self):
+        """Save settings shortly, coalescing rapid changes into one write"""
+        self._save_settings_timer.start()
+    
     def _save_settings(self):
         """Save settings to file"""
+        self._save_settings_timer.stop()
         settings_path = APP_DATA_DIR / "settings.json"
+        tmp_path = settings_path.with_suffix(".json.tmp")
         try:
-            with open(settings_path, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            if HAS_ORJSON:
+                data = orjson.dumps(self._settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = dump_settings(self._settings)
+            # Nothing changed since the last read or write
+            if data == self._saved_settings_data:
+                return
+            # Write a temp file and swap it in, so a crash can't leave a truncated file
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, settings_path)
+            self._saved_settings_data = data
         except Exception as e:
-            print(f"Failed to save settings: {e}")
+            logger.warning("Failed to save settings: %s", e)
     
     def _on_tray_activated(self, reason):
         """Handle tray icon activation"""
@@ -917,19 +1166,37 @@ class MainWindow(QMainWindow):
         self._force_quit = True
         self.close()
     
+    def showEvent(self, event):
+        """Flush updates that arrived while the window was hidden"""
+        super().showEvent(event)
+        if self._dirty_ids:
+            self._refresh_timer.start(0)
+    
+    def changeEvent(self, event):
+        """Flush updates that arrived while the window was minimized"""
+        super().changeEvent(event)
+        if (event.type() == QEvent.Type.WindowStateChange
+                and not self.isMinimized() and self._dirty_ids):
+            self._refresh_timer.start(0)
+    
     def closeEvent(self, event: QCloseEvent):
         """Handle window close event"""
         if self._settings.get('close_to_tray', False) and not getattr(self, '_force_quit', False):
             event.ignore()
             self.hide()
         else:
-            # Stop the update timer first
-            self._update_timer.stop()
+            # Stop the refresh timer first
+            self._refresh_timer.stop()
+
+            # Remember the window geometry; this also writes out any settings
+            # change still waiting for its debounce
+            self._settings['geometry'] = bytes(self.saveGeometry().toBase64()).decode()
+            self._save_settings()
 
-            # Save all downloads synchronously
+            # Save all downloads in a single transaction and wait until it is on disk
             if self._download_manager:
-                for download in self._download_manager.get_all_downloads():
-                    self._download_manager.db.save_download(download)
+                self._download_manager.db_writer.save_downloads(self._download_manager.get_all_downloads())
+                self._download_manager.db_writer.flush()
 
             # Close tray icon
             if hasattr(self, 'tray_icon'):
@@ -939,22 +1206,44 @@ class MainWindow(QMainWindow):
 
     def _on_tab_changed(self, index: int):
         """Handle tab change"""
-        if index == 1:  # History tab
+        if index == 0 and self._dirty_ids:  # Downloads tab - catch up on changes
+            self._refresh_timer.start(0)
+        elif index == 1:  # History tab
             self._refresh_history()
 
+    def _mark_history_dirty(self):
+        """Note that history changed; reload soon if it is on screen, else when shown"""
+        self._history_dirty = True
+        if self.tab_widget.currentIndex() == 1:
+            self._history_timer.start()
+
     def _refresh_history(self):
-        """Refresh the history view"""
+        """Refresh the history view if it changed since the last load"""
+        if not self._history_dirty:
+            return
         if hasattr(self, 'history_view') and self._download_manager:
+            self._history_dirty = False
+            # Read after the writes queued so far (usually none) are committed
+            self._download_manager.db_writer.flush()
             completed_downloads = self._download_manager.db.get_completed_downloads()
             self.history_view.set_downloads(completed_downloads)
 
     def _on_history_delete(self, download_id: str):
         """Handle delete from history"""
+        self._on_history_delete_many([download_id])
+
+    def _on_history_delete_many(self, download_ids: List[str]):
+        """Handle deleting several downloads from history at once"""
         if self._download_manager:
-            self._download_manager.db.delete_download(download_id)
-            if download_id in self._download_manager.downloads:
-                del self._download_manager.downloads[download_id]
-            self._refresh_history()
+            self._download_manager.db_writer.delete_downloads(download_ids)
+            for download_id in download_ids:
+                self._download_manager.downloads.pop(download_id, None)
+                self._untrack(download_id)
+            
+            # Drop their rows from both tabs without reloading either
+            self.history_view.remove_downloads(download_ids)
+            self.download_list.remove_downloads(download_ids)
+            self._schedule_list_state()
 
     def _on_history_retry(self, download_id: str):
         """Handle retry from history"""
@@ -970,15 +1259,10 @@ class MainWindow(QMainWindow):
                     segment.downloaded = 0
                     segment.completed = False
 
-                # Remove from history and add back to active downloads
-                self._download_manager.db.save_download(download)
+                # Save and start in one task; add back to active downloads meanwhile
+                self._run_async(self._retry_download(download))
                 self._add_download_widget(download)
 
-                # Start the download
-                asyncio.run_coroutine_threadsafe(
-                    self._download_manager.start_download(download_id),
-                    self._loop
-                )
-
-                # Refresh history
-                self._refresh_history()
+                # It leaves the history; the status index already records QUEUED,
+                # so the status callbacks that follow won't trigger a reload
+                self.history_view.remove_downloads([download_id])
@@ -5,96 +5,58 @@ Settings dialog - application settings
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFileDialog, QSpinBox, QGroupBox, QFormLayout,
-    QLineEdit, QCheckBox, QWidget, QComboBox, QTabWidget, QScrollArea
+    QLineEdit, QCheckBox, QWidget, QComboBox, QTabWidget, QScrollArea,
+    QAbstractSpinBox, QStyle, QStyleOptionSpinBox, QRadioButton, QButtonGroup
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-
-try:
-    import qtawesome as qta
-    HAS_QTAWESOME = True
-except ImportError:
-    HAS_QTAWESOME = False
+from PyQt6.QtGui import QFont, QPainter, QColor, QIntValidator
 
 from ..utils.constants import DEFAULT_DOWNLOAD_DIR, DEFAULT_SEGMENTS, DEFAULT_MAX_CONCURRENT
 
 
-class StyledSpinBox(QWidget):
-    """Custom SpinBox with visible +/- buttons"""
-    
-    valueChanged = pyqtSignal(int)
-    
+# Behavior checkboxes: (settings key, label, default)
+_BEHAVIOR_CHECKBOXES = (
+    ('start_minimized', "Start minimized to system tray", False),
+    ('close_to_tray', "Close to system tray instead of exiting", False),
+    ('notify_complete', "Show notification when download completes", True),
+    ('auto_start', "Start downloads automatically when added", True),
+    ('watch_clipboard', "Watch clipboard for download URLs", False),
+    ('confirm_cancel', "Ask before cancelling a download", True),
+)
+
+
+class StyledSpinBox(QSpinBox):
+    """Native spin box with visible -/+ buttons on either side (styled in the app theme)"""
+
+    _BUTTON_TEXT_COLOR = QColor('#eaeaea')
+    _BUTTON_LABELS = (
+        (QStyle.SubControl.SC_SpinBoxDown, "\u2212"),
+        (QStyle.SubControl.SC_SpinBoxUp, "+"),
+    )
+
     def __init__(self, min_val=1, max_val=100, value=1, parent=None):
         super().__init__(parent)
-        self._min = min_val
-        self._max = max_val
-        self._value = value
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-        
-        # Minus button
-        self.minus_btn = QPushButton("-")
-        self.minus_btn.setFixedSize(32, 32)
-        self.minus_btn.clicked.connect(self._decrement)
-        if HAS_QTAWESOME:
-            self.minus_btn.setIcon(qta.icon('fa5s.minus', color='#eaeaea'))
-            self.minus_btn.setText("")
-        layout.addWidget(self.minus_btn)
-        
-        # Value display
-        self.value_label = QLineEdit(str(self._value))
-        self.value_label.setFixedWidth(60)
-        self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.value_label.setReadOnly(True)
-        self.value_label.setStyleSheet("""
-            QLineEdit {
-                background-color: #16213e;
-                border: 2px solid #0f3460;
-                border-radius: 6px;
-                padding: 5px;
-                color: #eaeaea;
-                font-weight: bold;
-            }
-        """)
-        layout.addWidget(self.value_label)
-        
-        # Plus button
-        self.plus_btn = QPushButton("+")
-        self.plus_btn.setFixedSize(32, 32)
-        self.plus_btn.clicked.connect(self._increment)
-        if HAS_QTAWESOME:
-            self.plus_btn.setIcon(qta.icon('fa5s.plus', color='#eaeaea'))
-            self.plus_btn.setText("")
-        layout.addWidget(self.plus_btn)
-    
-    def _increment(self):
-        if self._value < self._max:
-            self._value += 1
-            self.value_label.setText(str(self._value))
-            self.valueChanged.emit(self._value)
-    
-    def _decrement(self):
-        if self._value > self._min:
-            self._value -= 1
-            self.value_label.setText(str(self._value))
-            self.valueChanged.emit(self._value)
-    
-    def value(self):
-        return self._value
-    
-    def setValue(self, val):
-        self._value = max(self._min, min(self._max, val))
-        self.value_label.setText(str(self._value))
-    
-    def setMinimum(self, val):
-        self._min = val
-    
-    def setMaximum(self, val):
-        self._max = val
+        self.setObjectName("styledSpin")
+        self.setRange(min_val, max_val)
+        self.setValue(value)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setFixedWidth(140)  # Same footprint as the old button/field/button row
+        self.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.PlusMinus)
+
+    def paintEvent(self, event):
+        """Draw the -/+ labels, which the stylesheet can't without image files"""
+        super().paintEvent(event)
+        option = QStyleOptionSpinBox()
+        self.initStyleOption(option)
+        painter = QPainter(self)
+        painter.setPen(self._BUTTON_TEXT_COLOR)
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        for sub_control, label in self._BUTTON_LABELS:
+            rect = self.style().subControlRect(QStyle.ComplexControl.CC_SpinBox, option, sub_control, self)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.end()
 
 
 class SettingsDialog(QDialog):
@@ -109,8 +71,27 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         
         self._settings = settings or {}
-        self._setup_ui()
-        self._load_settings()
+        self._ui_built = False  # Widgets are built the first time the dialog is shown
+
+    def setVisible(self, visible: bool):
+        """Build the widgets before the first show, so the initial size accounts for them"""
+        if visible:
+            self._ensure_ui()
+        super().setVisible(visible)
+
+    def _ensure_ui(self):
+        """Build the widgets and load the settings into them, once"""
+        if not self._ui_built:
+            self._ui_built = True
+            self._setup_ui()
+            self._load_settings()
+
+    def reset(self, settings: dict = None):
+        """Reload the fields from settings so a cached dialog can be shown again"""
+        self._settings = settings or {}
+        if self._ui_built:
+            self._load_settings()
+            self.tab_widget.setCurrentIndex(0)
     
     def _setup_ui(self):
         """Set up the dialog UI"""
@@ -129,29 +110,7 @@ class SettingsDialog(QDialog):
 
         # Create tab widget
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #0f3460;
-                border-radius: 8px;
-                background-color: #1a1a2e;
-            }
-            QTabBar::tab {
-                background-color: #16213e;
-                color: #eaeaea;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #0f3460;
-                color: #4cc9f0;
-            }
-            QTabBar::tab:hover {
-                background-color: #1a1a2e;
-            }
-        """)
+        self.tab_widget.setObjectName("settingsTabs")  # Styled by the app theme
         layout.addWidget(self.tab_widget)
 
         # Create tabs
@@ -212,22 +171,12 @@ class SettingsDialog(QDialog):
         behavior_group = QGroupBox("Behavior")
         behavior_layout = QFormLayout(behavior_group)
 
-        self.start_minimized_cb = QCheckBox("Start minimized to system tray")
-        behavior_layout.addRow(self.start_minimized_cb)
-
-        self.close_to_tray_cb = QCheckBox("Close to system tray instead of exiting")
-        behavior_layout.addRow(self.close_to_tray_cb)
-
-        self.notify_complete_cb = QCheckBox("Show notification when download completes")
-        self.notify_complete_cb.setChecked(True)
-        behavior_layout.addRow(self.notify_complete_cb)
-
-        self.auto_start_cb = QCheckBox("Start downloads automatically when added")
-        self.auto_start_cb.setChecked(True)
-        behavior_layout.addRow(self.auto_start_cb)
-
-        self.watch_clipboard_cb = QCheckBox("Watch clipboard for download URLs")
-        behavior_layout.addRow(self.watch_clipboard_cb)
+        # One checkbox per behavior setting, stored as self.<key>_cb
+        for key, text, default in _BEHAVIOR_CHECKBOXES:
+            checkbox = QCheckBox(text)
+            checkbox.setChecked(default)
+            setattr(self, f"{key}_cb", checkbox)
+            behavior_layout.addRow(checkbox)
 
         layout.addWidget(behavior_group)
 
@@ -254,17 +203,23 @@ class SettingsDialog(QDialog):
         speed_limit_layout = QHBoxLayout()
         self.speed_limit_input = QLineEdit()
         self.speed_limit_input.setText("0")
+        self.speed_limit_input.setValidator(QIntValidator(0, 1_000_000, self))
         self.speed_limit_input.setEnabled(False)
         speed_limit_layout.addWidget(self.speed_limit_input)
 
-        self.speed_limit_unit = QComboBox()
-        self.speed_limit_unit.addItem("KB/s", 1024)
-        self.speed_limit_unit.addItem("MB/s", 1024 * 1024)
-        self.speed_limit_unit.setEnabled(False)
-        speed_limit_layout.addWidget(self.speed_limit_unit)
+        # Two radio buttons; each button's group id is its bytes-per-unit multiplier
+        self.speed_limit_kb = QRadioButton("KB/s")
+        self.speed_limit_kb.setChecked(True)
+        self.speed_limit_mb = QRadioButton("MB/s")
+        self.speed_limit_unit = QButtonGroup(self)
+        self.speed_limit_unit.addButton(self.speed_limit_kb, 1024)
+        self.speed_limit_unit.addButton(self.speed_limit_mb, 1024 * 1024)
+        for button in (self.speed_limit_kb, self.speed_limit_mb):
+            button.setEnabled(False)
+            speed_limit_layout.addWidget(button)
 
         self.speed_limit_unlimited = QLabel("(0 = unlimited)")
-        self.speed_limit_unlimited.setStyleSheet("color: #888; font-size: 11px;")
+        self.speed_limit_unlimited.setObjectName("hintLabel")
         speed_limit_layout.addWidget(self.speed_limit_unlimited)
 
         bandwidth_layout.addRow("Speed Limit:", speed_limit_layout)
@@ -348,7 +303,7 @@ class SettingsDialog(QDialog):
         retry_delay_layout.addWidget(self.retry_delay_unit)
 
         self.retry_delay_hint = QLabel("(before first retry)")
-        self.retry_delay_hint.setStyleSheet("color: #888; font-size: 11px;")
+        self.retry_delay_hint.setObjectName("hintLabel")
         retry_delay_layout.addWidget(self.retry_delay_hint)
 
         retry_layout.addRow("Retry Delay:", retry_delay_layout)
@@ -360,7 +315,7 @@ class SettingsDialog(QDialog):
         backoff_layout.addWidget(self.retry_backoff_input)
 
         self.retry_backoff_unit = QLabel("x (multiplier)")
-        self.retry_backoff_unit.setStyleSheet("color: #888; font-size: 11px;")
+        self.retry_backoff_unit.setObjectName("hintLabel")
         backoff_layout.addWidget(self.retry_backoff_unit)
 
         retry_layout.addRow("Backoff:", backoff_layout)
@@ -384,7 +339,8 @@ class SettingsDialog(QDialog):
     def _on_limit_speed_toggled(self, checked: bool):
         """Handle limit speed checkbox toggle"""
         self.speed_limit_input.setEnabled(checked)
-        self.speed_limit_unit.setEnabled(checked)
+        self.speed_limit_kb.setEnabled(checked)
+        self.speed_limit_mb.setEnabled(checked)
 
     def _on_proxy_enabled_toggled(self, checked: bool):
         """Handle proxy enabled checkbox toggle"""
@@ -412,30 +368,17 @@ class SettingsDialog(QDialog):
             self.limit_speed_cb.setChecked(True)
             # Determine unit (KB or MB)
             if rate_limit >= 1024 * 1024:
-                self.speed_limit_unit.setCurrentIndex(1)  # MB/s
+                self.speed_limit_mb.setChecked(True)
                 self.speed_limit_input.setText(str(rate_limit // (1024 * 1024)))
             else:
-                self.speed_limit_unit.setCurrentIndex(0)  # KB/s
+                self.speed_limit_kb.setChecked(True)
                 self.speed_limit_input.setText(str(rate_limit // 1024))
         else:
             self.limit_speed_cb.setChecked(False)
             self.speed_limit_input.setText("0")
 
-        self.start_minimized_cb.setChecked(
-            self._settings.get('start_minimized', False)
-        )
-        self.close_to_tray_cb.setChecked(
-            self._settings.get('close_to_tray', False)
-        )
-        self.notify_complete_cb.setChecked(
-            self._settings.get('notify_complete', True)
-        )
-        self.auto_start_cb.setChecked(
-            self._settings.get('auto_start', True)
-        )
-        self.watch_clipboard_cb.setChecked(
-            self._settings.get('watch_clipboard', False)
-        )
+        for key, _, default in _BEHAVIOR_CHECKBOXES:
+            getattr(self, f"{key}_cb").setChecked(self._settings.get(key, default))
 
         # Load retry settings
         self.enable_retry_cb.setChecked(
@@ -475,27 +418,29 @@ class SettingsDialog(QDialog):
 
     def _on_save_click(self):
         """Handle save button click"""
+        self.settings_changed.emit(self.get_settings())
+        self.accept()
+
+    def get_settings(self) -> dict:
+        """Get current settings from UI"""
+        if not self._ui_built:
+            return dict(self._settings)
+
         # Calculate rate limit in bytes per second
-        if self.limit_speed_cb.isChecked():
-            try:
-                value = float(self.speed_limit_input.text())
-                unit_multiplier = self.speed_limit_unit.currentData()
-                rate_limit = int(value * unit_multiplier)
-            except ValueError:
-                rate_limit = 0
-        else:
-            rate_limit = 0
+        # The validator may accept locale group separators ("1,000"), so parse with its locale
+        rate_limit = 0
+        if self.limit_speed_cb.isChecked() and self.speed_limit_input.hasAcceptableInput():
+            value, ok = self.speed_limit_input.validator().locale().toInt(self.speed_limit_input.text())
+            if ok:
+                rate_limit = value * self.speed_limit_unit.checkedId()
 
-        settings = {
+        return {
             'download_dir': self.download_dir_input.text(),
             'default_segments': self.segments_spin.value(),
             'max_concurrent': self.concurrent_spin.value(),
             'rate_limit': rate_limit,
-            'start_minimized': self.start_minimized_cb.isChecked(),
-            'close_to_tray': self.close_to_tray_cb.isChecked(),
-            'notify_complete': self.notify_complete_cb.isChecked(),
-            'auto_start': self.auto_start_cb.isChecked(),
-            'watch_clipboard': self.watch_clipboard_cb.isChecked(),
+            # Behavior settings
+            **{key: getattr(self, f"{key}_cb").isChecked() for key, _, _ in _BEHAVIOR_CHECKBOXES},
             # Retry settings
             'enable_retry': self.enable_retry_cb.isChecked(),
             'max_retries': self.max_retries_spin.value(),
@@ -509,19 +454,3 @@ class SettingsDialog(QDialog):
             'proxy_username': self.proxy_username_input.text().strip(),
             'proxy_password': self.proxy_password_input.text()
         }
-
-        self.settings_changed.emit(settings)
-        self.accept()
-    
-    def get_settings(self) -> dict:
-        """Get current settings from UI"""
-        return {
-            'download_dir': self.download_dir_input.text(),
-            'default_segments': self.segments_spin.value(),
-            'max_concurrent': self.concurrent_spin.value(),
-            'start_minimized': self.start_minimized_cb.isChecked(),
-            'close_to_tray': self.close_to_tray_cb.isChecked(),
-            'notify_complete': self.notify_complete_cb.isChecked(),
-            'auto_start': self.auto_start_cb.isChecked(),
-            'watch_clipboard': self.watch_clipboard_cb.isChecked()
-        }
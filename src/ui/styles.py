@@ -2,6 +2,28 @@
 Application styling - Dark theme QSS
 """
 
+# Colors for status indicators
+STATUS_COLORS = {
+    'downloading': '#4CAF50',  # Green
+    'paused': '#FFC107',       # Yellow
+    'queued': '#2196F3',       # Blue
+    'completed': '#9C27B0',    # Purple
+    'failed': '#F44336',       # Red
+    'cancelled': '#9E9E9E'     # Gray
+}
+
+# Progress bar chunk color per download status, selected through the bar's
+# "status" dynamic property so every download item shares one stylesheet
+_PROGRESS_STATUS_RULES = "".join(
+    f"""
+QProgressBar[status="{status}"]::chunk {{
+    background-color: {color};
+    border-radius: 8px;
+}}
+"""
+    for status, color in STATUS_COLORS.items()
+)
+
 DARK_THEME = """
 /* Global Styles */
 QWidget {
@@ -259,6 +281,37 @@ QLabel#statusLabel {
     padding: 2px 0;
 }
 
+QLabel#hintLabel {
+    font-size: 11px;
+    color: #888;
+}
+
+/* Settings dialog tabs */
+QTabWidget#settingsTabs::pane {
+    border: 1px solid #0f3460;
+    border-radius: 8px;
+    background-color: #1a1a2e;
+}
+
+QTabWidget#settingsTabs QTabBar::tab {
+    background-color: #16213e;
+    color: #eaeaea;
+    padding: 10px 20px;
+    margin-right: 2px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+    font-weight: bold;
+}
+
+QTabWidget#settingsTabs QTabBar::tab:selected {
+    background-color: #0f3460;
+    color: #4cc9f0;
+}
+
+QTabWidget#settingsTabs QTabBar::tab:hover {
+    background-color: #1a1a2e;
+}
+
 /* Group Box */
 QGroupBox {
     background-color: #16213e;
@@ -331,6 +384,35 @@ QSpinBox::up-button, QSpinBox::down-button {
     border: none;
 }
 
+/* Settings spin boxes - minus on the left, plus on the right */
+QSpinBox#styledSpin {
+    border-radius: 6px;
+    padding: 5px 4px;
+    font-weight: bold;
+    min-width: 60px;
+}
+
+QSpinBox#styledSpin::up-button, QSpinBox#styledSpin::down-button {
+    subcontrol-origin: border;
+    width: 32px;
+    height: 32px;
+    border: none;
+    border-radius: 6px;
+    background-color: #0f3460;
+}
+
+QSpinBox#styledSpin::up-button {
+    subcontrol-position: center right;
+}
+
+QSpinBox#styledSpin::down-button {
+    subcontrol-position: center left;
+}
+
+QSpinBox#styledSpin::up-button:hover, QSpinBox#styledSpin::down-button:hover {
+    background-color: #e94560;
+}
+
 /* Dialog */
 QDialog {
     background-color: #1a1a2e;
@@ -377,18 +459,4 @@ QMenu#trayMenu {
     border-radius: 10px;
     padding: 8px;
 }
-"""
-
-# Colors for status indicators
-STATUS_COLORS = {
-    'downloading': '#4CAF50',  # Green
-    'paused': '#FFC107',       # Yellow
-    'queued': '#2196F3',       # Blue
-    'completed': '#9C27B0',    # Purple
-    'failed': '#F44336',       # Red
-    'cancelled': '#9E9E9E'     # Gray
-}
-
-def get_status_color(status: str) -> str:
-    """Get the color for a download status"""
-    return STATUS_COLORS.get(status, '#eaeaea')
+""" + _PROGRESS_STATUS_RULES
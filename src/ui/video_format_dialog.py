@@ -3,6 +3,7 @@ Video format selection dialog
 """
 
 import asyncio
+import logging
 import shutil
 from typing import Dict, Any
 from PyQt6.QtWidgets import (
@@ -20,6 +21,9 @@ except ImportError:
     HAS_QTAWESOME = False
 
 
+logger = logging.getLogger(__name__)
+
+
 def check_ffmpeg_available() -> bool:
     """Check if FFmpeg is available on the system"""
     return shutil.which('ffmpeg') is not None
@@ -321,7 +325,6 @@ class VideoFormatDialog(QDialog):
     def _load_thumbnail(self, url: str):
         """Load video thumbnail"""
         try:
-            from ..core.downloader import DownloadManager
             import aiohttp
 
             async def fetch_thumbnail():
@@ -334,19 +337,15 @@ class VideoFormatDialog(QDialog):
                                 # Load pixmap on main thread
                                 QTimer.singleShot(0, lambda: self._display_thumbnail(data))
                 except Exception as e:
-                    print(f"Error loading thumbnail: {e}")
-
-            # Run in existing event loop
-            from PyQt6.QtWidgets import QApplication
-            window = QApplication.activeWindow()
-            if hasattr(window, '_loop'):
-                asyncio.run_coroutine_threadsafe(
-                    fetch_thumbnail(),
-                    window._loop
-                )
+                    logger.warning("Error loading thumbnail: %s", e)
+
+            # Run on the main window's event loop, which is pumped on this thread
+            window = self.parent()
+            if getattr(window, '_loop', None):
+                window._run_async(fetch_thumbnail())
 
         except Exception as e:
-            print(f"Error loading thumbnail: {e}")
+            logger.warning("Error loading thumbnail: %s", e)
             self.thumbnail_label.setText("No Image")
 
     def _display_thumbnail(self, data: bytes):
@@ -66,6 +66,19 @@ CATEGORIES: Dict[str, Category] = {
 }
 
 
+def _build_extension_map() -> Dict[str, str]:
+    """Map each extension to its category key (the first category listing it wins)"""
+    extension_map: Dict[str, str] = {}
+    for category_key, category in CATEGORIES.items():
+        for ext in category.extensions:
+            extension_map.setdefault(ext, category_key)
+    return extension_map
+
+
+# Built once so filename lookups are a single dict access
+_EXTENSION_CATEGORIES = _build_extension_map()
+
+
 def get_category_from_filename(filename: str) -> str:
     """
     Determine category from filename extension.
@@ -76,15 +89,7 @@ def get_category_from_filename(filename: str) -> str:
     Returns:
         Category key (e.g., 'videos', 'images', 'all')
     """
-    ext = Path(filename).suffix.lower()
-
-    for category_key, category in CATEGORIES.items():
-        if category_key == "all":
-            continue
-        if ext in category.extensions:
-            return category_key
-
-    return "all"
+    return _EXTENSION_CATEGORIES.get(Path(filename).suffix.lower(), "all")
 
 
 def get_category_from_content_type(content_type: str) -> str:
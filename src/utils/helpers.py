@@ -4,12 +4,14 @@ Helper utility functions
 
 import os
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, unquote
 from typing import Optional
 
 from .constants import SIZE_UNITS
 
 
+@lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
     """Format bytes to human readable string"""
     if size_bytes == 0:
@@ -30,6 +32,7 @@ def format_speed(bytes_per_second: float) -> str:
     return f"{format_size(int(bytes_per_second))}/s"
 
 
+@lru_cache(maxsize=4096)
 def format_time(seconds: int) -> str:
     """Format seconds to human readable time string"""
     if seconds < 0:
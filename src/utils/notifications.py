@@ -2,11 +2,15 @@
 Cross-platform notification manager for download events
 """
 
+import logging
 import platform
 import subprocess
 from typing import Optional
 
 
+logger = logging.getLogger(__name__)
+
+
 class NotificationManager:
     """
     Cross-platform notification manager.
@@ -80,7 +84,7 @@ class NotificationManager:
             elif self.system == "Linux":
                 self._show_linux(title, message)
         except Exception as e:
-            print(f"Failed to show notification: {e}")
+            logger.warning("Failed to show notification: %s", e)
 
     def _show_windows(self, title: str, message: str):
         """Show Windows toast notification"""